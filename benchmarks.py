@@ -0,0 +1,189 @@
+"""
+Performance benchmarks for the health-care fuzzy model.
+
+Measures cold import and model-file load time, ``ctrl.ControlSystem(rules)``
+construction, single-sample latency through ``ControlSystemSimulation``,
+batch throughput of the compiled engine at 1k/100k/1M samples and GA
+generations per second at main.py's ``population_size``/``num_generations``.
+Results are written as JSON; ``--compare`` checks them against an earlier
+run and exits non-zero on a regression beyond ``--threshold``.
+
+    python benchmarks.py --output baseline.json
+    python benchmarks.py --compare baseline.json --threshold 0.2
+"""
+import argparse
+import json
+import os
+import platform
+import subprocess
+import sys
+import itertools
+import tempfile
+import time
+import timeit
+
+import numpy as np
+
+BATCH_SIZES = (1000, 100000, 1000000)
+
+
+def _best_of(func, repeats):
+    best = np.inf
+    for _ in range(repeats):
+        start = time.perf_counter()
+        func()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def _cold(statement):
+    """
+    Returns the seconds a fresh interpreter takes to run ``statement``.
+    """
+    start = time.perf_counter()
+    subprocess.run([sys.executable, '-c', statement], check=True, cwd=os.path.dirname(os.path.abspath(__file__)))
+    return time.perf_counter() - start
+
+
+def bench_startup(repeats=3):
+    import health_care
+    from model_file import save_model
+
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, 'model.npz')
+        save_model(health_care.health_care_engine, path)
+        model_load = min(_cold("import model_file; model_file.load_model(%r)" % path) for _ in range(repeats))
+    return {
+        'import_seconds': min(health_care.measure_import_time() for _ in range(repeats)),
+        'model_load_seconds': model_load,
+    }
+
+
+def bench_control_system(loops=5, repeats=5):
+    import health_care
+    from skfuzzy import control as ctrl
+
+    start = time.perf_counter()
+    system = ctrl.ControlSystem(health_care.rules)
+    build = time.perf_counter() - start
+
+    # No result cache, so repeated inputs are computed every time
+    sim = ctrl.ControlSystemSimulation(system, cache=False)
+    rng = np.random.default_rng(0)
+    vitals = itertools.cycle(zip(rng.uniform(60, 130, loops), rng.uniform(90, 190, loops), rng.uniform(98, 107, loops)))
+
+    def compute():
+        diastolic, systolic, temperature = next(vitals)
+        sim.input['Diastolic Blood Pressure'] = diastolic
+        sim.input['Systolic Blood Pressure'] = systolic
+        sim.input['Temperature'] = temperature
+        sim.compute()
+
+    seconds = min(timeit.repeat(compute, number=loops, repeat=repeats))
+    return {
+        'control_system_build_seconds': build,
+        'single_sample_latency_ms': seconds / loops * 1000.0,
+    }
+
+
+def bench_batch(sizes=BATCH_SIZES, repeats=3):
+    import health_care
+    from resolution_sweep import random_vitals
+
+    engine = health_care.health_care_engine
+    results = {}
+    for size in sizes:
+        inputs = random_vitals(size)
+        seconds = _best_of(lambda: engine.compute(*inputs), repeats if size < 1000000 else 1)
+        results['batch_%d_samples_per_second' % size] = size / seconds
+    return results
+
+
+def bench_ga(repeats=3):
+    import main
+
+    # A checkpoint would make every run after the first resume a finished one
+    checkpoint_path = main.checkpoint_path
+    main.checkpoint_path = None
+    try:
+        best = 0.0
+        for _ in range(repeats):
+            main.weights_fitness.cache_clear()
+            start = time.perf_counter()
+            _, _, logbook = main.run_ga(verbose=False)
+            seconds = time.perf_counter() - start
+            # Generations actually run, fewer than num_generations after an early stop
+            best = max(best, max(logbook.select('gen')) / seconds)
+    finally:
+        main.checkpoint_path = checkpoint_path
+    return {'ga_generations_per_second': best}
+
+
+def run(quick=False):
+    """
+    Returns all metrics as a dict. ``quick`` skips the slow skfuzzy
+    ControlSystem benchmarks and the 1M-sample batch.
+    """
+    results = {}
+    results.update(bench_startup())
+    if not quick:
+        results.update(bench_control_system())
+    results.update(bench_batch(BATCH_SIZES[:-1] if quick else BATCH_SIZES))
+    results.update(bench_ga())
+    return results
+
+
+def higher_is_better(metric):
+    return metric.endswith('per_second')
+
+
+def regressions(results, baseline, threshold):
+    """
+    Returns (metric, baseline, current, relative change) for every metric
+    that got worse than ``baseline`` by more than ``threshold`` (a fraction).
+    """
+    found = []
+    for metric, old in baseline.items():
+        new = results.get(metric)
+        if new is None or not old:
+            continue
+        change = (new - old) / old
+        worse = -change if higher_is_better(metric) else change
+        if worse > threshold:
+            found.append((metric, old, new, change))
+    return found
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Benchmark the health-care fuzzy model.")
+    parser.add_argument('--output', help="write results JSON here (default: stdout)")
+    parser.add_argument('--compare', help="baseline results JSON to check against")
+    parser.add_argument('--threshold', type=float, default=0.2, help="allowed relative regression (default 0.2)")
+    parser.add_argument('--quick', action='store_true', help="skip the skfuzzy ControlSystem and 1M-sample benchmarks")
+    args = parser.parse_args(argv)
+
+    report = {
+        'python': platform.python_version(),
+        'machine': platform.machine(),
+        'cpu_count': os.cpu_count(),
+        'metrics': run(quick=args.quick),
+    }
+    text = json.dumps(report, indent=2)
+    if args.output:
+        with open(args.output, 'w') as f:
+            f.write(text + '\n')
+    else:
+        print(text)
+
+    if args.compare:
+        with open(args.compare) as f:
+            baseline = json.load(f)['metrics']
+        found = regressions(report['metrics'], baseline, args.threshold)
+        for metric, old, new, change in found:
+            print("REGRESSION %s: %.4g -> %.4g (%+.0f%%)" % (metric, old, new, change * 100), file=sys.stderr)
+        if found:
+            sys.exit(1)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,178 @@
+"""
+Bitboard Tic Tac Toe engine.
+
+A board is two 9-bit integers, one per player, with cell (i, j) at bit
+3 * i + j. Moves are made and unmade in place, wins are found by testing
+only the line masks through the cell just played, and the search never
+copies a board. ``minimax`` takes and returns the list-of-lists board and
+(i, j) moves of tictactoe.py, and picks the same moves as
+``tictactoe.minimax``.
+"""
+from tictactoe import X, O, EMPTY, LINES, CENTER, CORNERS
+
+FULL = (1 << 9) - 1
+LINE_MASKS = [sum(1 << (3 * i + j) for i, j in line) for line in LINES]
+# Masks of the lines through each cell
+CELL_LINES = [[mask for mask in LINE_MASKS if mask & (1 << cell)] for cell in range(9)]
+# Cells in search order before win/block checks: center, corners, edges
+STATIC_ORDER = [3 * CENTER[0] + CENTER[1]] + [3 * i + j for i, j in CORNERS] + [1, 3, 5, 7]
+
+
+def _popcount(bits):
+    return bin(bits).count('1')
+
+
+class BitBoard:
+    """
+    Mutable board for the search; ``make``/``unmake`` take cell indices.
+    """
+
+    def __init__(self, x=0, o=0):
+        self.x = x
+        self.o = o
+        self.count_x = _popcount(x)
+        self.count_o = _popcount(o)
+        self.won = None
+        for mark, bits in ((X, x), (O, o)):
+            if any(bits & mask == mask for mask in LINE_MASKS):
+                self.won = mark
+        self.history = []
+
+    @classmethod
+    def from_board(cls, board):
+        x = o = 0
+        for i in range(3):
+            for j in range(3):
+                if board[i][j] == X:
+                    x |= 1 << (3 * i + j)
+                elif board[i][j] == O:
+                    o |= 1 << (3 * i + j)
+        return cls(x, o)
+
+    def to_board(self):
+        return [[X if self.x >> (3 * i + j) & 1 else O if self.o >> (3 * i + j) & 1 else EMPTY
+                 for j in range(3)] for i in range(3)]
+
+    def player(self):
+        return O if self.count_x > self.count_o else X
+
+    def winner(self):
+        return self.won
+
+    def terminal(self):
+        return self.won is not None or (self.x | self.o) == FULL
+
+    def actions(self):
+        """
+        Returns the empty cells in row-major order, like tictactoe.actions.
+        """
+        taken = self.x | self.o
+        return [cell for cell in range(9) if not taken >> cell & 1]
+
+    def make(self, cell):
+        bit = 1 << cell
+        if (self.x | self.o) & bit:
+            raise ValueError("Invalid action: cell already taken")
+        self.history.append((cell, self.won))
+        if self.player() == X:
+            self.x |= bit
+            self.count_x += 1
+            bits, mark = self.x, X
+        else:
+            self.o |= bit
+            self.count_o += 1
+            bits, mark = self.o, O
+        if self.won is None:
+            for mask in CELL_LINES[cell]:
+                if bits & mask == mask:
+                    self.won = mark
+                    break
+
+    def unmake(self):
+        cell, self.won = self.history.pop()
+        bit = 1 << cell
+        if self.x & bit:
+            self.x &= ~bit
+            self.count_x -= 1
+        else:
+            self.o &= ~bit
+            self.count_o -= 1
+
+    def _completing(self, bits):
+        empty = ~(self.x | self.o) & FULL
+        cells = 0
+        for mask in LINE_MASKS:
+            rest = mask & ~bits
+            # One cell of the line left and it is empty
+            if rest and rest & (rest - 1) == 0 and rest & empty:
+                cells |= rest
+        return cells
+
+    def ordered_actions(self):
+        """
+        Returns the empty cells with tictactoe.ordered_actions priorities:
+        wins, blocks, then center, corners and edges.
+        """
+        own, other = (self.x, self.o) if self.player() == X else (self.o, self.x)
+        wins = self._completing(own)
+        blocks = self._completing(other) & ~wins
+        taken = self.x | self.o
+        ordered = [cell for cell in range(9) if wins >> cell & 1] + \
+                  [cell for cell in range(9) if blocks >> cell & 1]
+        return ordered + [cell for cell in STATIC_ORDER
+                          if not (taken >> cell & 1 or (wins | blocks) >> cell & 1)]
+
+
+def alphabeta_value(bitboard, alpha=float('-inf'), beta=float('inf'), stats=None):
+    """
+    Returns tictactoe.alphabeta_value for a BitBoard, leaving it unchanged.
+    """
+    if stats is not None:
+        stats.nodes += 1
+    if bitboard.won is not None:
+        # tictactoe.utility gives won boards no value
+        return None
+    if (bitboard.x | bitboard.o) == FULL:
+        return 0
+
+    maximizing = bitboard.player() == X
+    value = float('-inf') if maximizing else float('inf')
+    for cell in bitboard.ordered_actions():
+        bitboard.make(cell)
+        score = alphabeta_value(bitboard, alpha, beta, stats)
+        bitboard.unmake()
+        if score is None:
+            continue
+        if maximizing and score > value:
+            value = score
+            alpha = max(alpha, value)
+            if alpha >= beta:
+                break
+        elif not maximizing and score < value:
+            value = score
+            beta = min(beta, value)
+            if alpha >= beta:
+                break
+    return value
+
+
+def minimax(board, stats=None):
+    """
+    Returns the optimal move (i, j) for a list-of-lists board, or None if
+    the game is over.
+    """
+    bitboard = BitBoard.from_board(board)
+    if bitboard.terminal():
+        return None
+
+    maximizing = bitboard.player() == X
+    best_move = None
+    best_score = float('-inf') if maximizing else float('inf')
+    for cell in bitboard.actions():
+        bitboard.make(cell)
+        score = alphabeta_value(bitboard, stats=stats)
+        bitboard.unmake()
+        if score is not None and ((maximizing and score > best_score) or (not maximizing and score < best_score)):
+            best_score = score
+            best_move = divmod(cell, 3)
+    return best_move
@@ -0,0 +1,79 @@
+"""
+Labelled vitals datasets for tuning the rule weights.
+"""
+import csv
+
+import numpy as np
+
+INPUT_COLUMNS = ('diastolic', 'systolic', 'temperature')
+TARGET_COLUMN = 'health_care'
+
+
+class VitalsDataset:
+    """
+    Vitals readings with their expected Health Care score.
+
+    ``inputs`` is a tuple of one array per INPUT_COLUMNS entry and
+    ``targets`` the matching array of scores.
+    """
+
+    def __init__(self, inputs, targets):
+        self.inputs = tuple(np.asarray(x, dtype=np.float64) for x in inputs)
+        self.targets = np.asarray(targets, dtype=np.float64)
+        if any(x.shape != self.targets.shape for x in self.inputs):
+            raise ValueError("Inputs and targets must have the same length")
+
+    def __len__(self):
+        return len(self.targets)
+
+    @classmethod
+    def load(cls, path):
+        """
+        Reads a dataset from ``.npy`` or CSV.
+
+        An ``.npy`` file holds an (n, 4) array with columns in
+        INPUT_COLUMNS + (TARGET_COLUMN,) order. A CSV file needs a header
+        naming those columns; their order does not matter and other columns
+        are ignored.
+        """
+        if str(path).endswith('.npy'):
+            data = np.load(path)
+            if data.ndim != 2 or data.shape[1] != len(INPUT_COLUMNS) + 1:
+                raise ValueError("Expected an (n, %d) array in %s" % (len(INPUT_COLUMNS) + 1, path))
+            return cls(tuple(data[:, :-1].T), data[:, -1])
+
+        with open(path, newline='') as f:
+            reader = csv.reader(f)
+            header = [name.strip().lower() for name in next(reader)]
+            missing = [name for name in INPUT_COLUMNS + (TARGET_COLUMN,) if name not in header]
+            if missing:
+                raise ValueError("%s is missing columns: %s" % (path, ', '.join(missing)))
+            columns = [header.index(name) for name in INPUT_COLUMNS + (TARGET_COLUMN,)]
+            data = np.array([[float(row[c]) for c in columns] for row in reader if row], dtype=np.float64)
+        data = data.reshape(-1, len(columns))
+        return cls(tuple(data[:, :-1].T), data[:, -1])
+
+    def subset(self, index):
+        """
+        Returns the rows selected by ``index`` as a new dataset.
+        """
+        return VitalsDataset(tuple(x[index] for x in self.inputs), self.targets[index])
+
+    def sample(self, size, seed=0):
+        """
+        Returns ``size`` rows drawn without replacement, or the whole
+        dataset if it is not larger than that.
+        """
+        if size is None or size >= len(self):
+            return self
+        rng = np.random.default_rng(seed)
+        return self.subset(np.sort(rng.choice(len(self), size, replace=False)))
+
+
+def mean_absolute_error(outputs, targets, penalty):
+    """
+    Returns the mean absolute error, counting samples where no rule fired
+    (NaN output) as ``penalty``.
+    """
+    errors = np.abs(outputs - targets)
+    return float(np.where(np.isnan(errors), penalty, errors).mean())
@@ -0,0 +1,579 @@
+"""
+Vectorized batch inference for the health-care fuzzy system.
+
+Evaluates the same Mamdani rule base that ``ctrl.ControlSystemSimulation``
+runs (min for AND, max accumulation, centroid defuzzification) on whole
+NumPy arrays of inputs at once instead of one sample per simulation.
+
+    python fuzzy_engine.py
+
+checks that the sparse and dense inference paths agree.
+"""
+import numpy as np
+
+from rule_tensor import RuleTensor, WILDCARD, _rule_weight, rule_variables
+
+
+def centroid_weights(x):
+    """
+    Returns (area, moment) vectors such that ``mf @ area`` and ``mf @ moment``
+    are the area and first moment of the piecewise-linear ``mf`` on ``x``.
+
+    Both are linear in the membership values, so the per-segment formulas
+    of ``skfuzzy.defuzz(..., 'centroid')`` fold into two dot products.
+    """
+    x = np.asarray(x, dtype=np.float64)
+    dx = np.diff(x)
+    area = np.zeros_like(x)
+    area[:-1] += 0.5 * dx
+    area[1:] += 0.5 * dx
+    moment = np.zeros_like(x)
+    moment[:-1] += 0.5 * dx * x[:-1] + dx * dx / 6.0
+    moment[1:] += 0.5 * dx * x[:-1] + dx * dx / 3.0
+    return area, moment
+
+
+def centroid(x, mf, weights=None):
+    """
+    Returns the centroid of each row of ``mf`` sampled on ``x``.
+
+    Same piecewise-linear area formula as ``skfuzzy.defuzz(..., 'centroid')``,
+    applied to a (samples, len(x)) matrix. Rows with zero area give NaN.
+    ``weights`` may pass in precomputed ``centroid_weights(x)``.
+    """
+    area, moment = centroid_weights(x) if weights is None else weights
+    total_area = mf @ area
+    total_moment = mf @ moment
+    with np.errstate(invalid='ignore', divide='ignore'):
+        return np.where(total_area > 0, total_moment / total_area, np.nan)
+
+
+def trimf(x, a, b, c):
+    """
+    Returns the triangular membership of ``x``, like ``fuzz.trimf`` but
+    evaluated at arbitrary points instead of on a sampled universe.
+    """
+    if a == b:
+        return np.interp(x, [b, c], [1.0, 0.0], left=0.0, right=0.0)
+    if b == c:
+        return np.interp(x, [a, b], [0.0, 1.0], left=0.0, right=0.0)
+    return np.interp(x, [a, b, c], [0.0, 1.0, 0.0])
+
+
+def triangle_params(x, mf, tol=1e-6):
+    """
+    Returns the (a, b, c) triangle that ``mf`` samples on ``x``, or None if
+    it is not a sampled triangle (e.g. a trapezoid or a Gaussian).
+
+    Edges are recovered from the slopes between neighbouring samples, so
+    peaks that fall between samples (like ``automf`` places them) come out
+    exact. A shoulder term that starts at 1 gets a == b or b == c.
+    """
+    x = np.asarray(x, dtype=np.float64)
+    mf = np.asarray(mf, dtype=np.float64)
+    y1, y2 = mf[:-1], mf[1:]
+    rising = np.flatnonzero((y1 > 0) & (y2 > y1))
+    falling = np.flatnonzero((y2 > 0) & (y1 > y2))
+    peak = x[np.argmax(mf)]
+    if len(rising):
+        i = rising[0]
+        slope_r = (mf[i + 1] - mf[i]) / (x[i + 1] - x[i])
+        a = x[i] - mf[i] / slope_r
+    if len(falling):
+        j = falling[-1]
+        slope_f = (mf[j] - mf[j + 1]) / (x[j + 1] - x[j])
+        c = x[j + 1] + mf[j + 1] / slope_f
+    if len(rising) and len(falling):
+        b = (slope_r * a + slope_f * c) / (slope_r + slope_f)
+    elif len(falling):
+        a = b = peak
+    elif len(rising):
+        b = c = peak
+    else:
+        return None
+    with np.errstate(invalid='ignore', divide='ignore'):
+        left = np.where(x < b, (x - a) / (b - a), 1.0)
+        right = np.where(x > b, (c - x) / (c - b), 1.0)
+    expected = np.clip(np.minimum(left, right), 0.0, 1.0)
+    if np.abs(expected - mf).max() > tol:
+        return None
+    return a, b, c
+
+
+def _plateau_moments(a, c, slope_r, slope_f, cap, lo, hi):
+    """
+    Returns (area, moment) over [lo, hi] of the function that rises from 0
+    at ``a`` with ``slope_r``, is flat at ``cap`` and falls to 0 at ``c``
+    with ``slope_f``. ``cap`` is an array, one value per sample.
+    """
+    with np.errstate(divide='ignore'):
+        x1 = a + cap / slope_r
+        x2 = c - cap / slope_f
+    zero = np.zeros_like(cap)
+    area = np.zeros_like(cap)
+    moment = np.zeros_like(cap)
+    for xa, ya, xb, yb in ((a, zero, x1, cap), (x1, cap, x2, cap), (x2, cap, c, zero)):
+        xa = np.broadcast_to(xa, cap.shape)
+        xb = np.broadcast_to(xb, cap.shape)
+        width = xb - xa
+        with np.errstate(invalid='ignore', divide='ignore'):
+            slope = np.where(width > 0, (yb - ya) / width, 0.0)
+        left = np.clip(xa, lo, hi)
+        right = np.clip(xb, lo, hi)
+        y_left = ya + slope * (left - xa)
+        y_right = ya + slope * (right - xa)
+        dx = right - left
+        segment = 0.5 * dx * (y_left + y_right)
+        area += segment
+        moment += segment * left + dx * dx * (y_left + 2.0 * y_right) / 6.0
+    return area, moment
+
+
+class BatchInference:
+    """
+    Array-at-a-time evaluation of a compiled ``RuleTensor``.
+
+    ``universes`` and ``term_mfs`` hold the sampled universe and term
+    membership arrays of each antecedent, in ``tensor.variables`` and
+    ``tensor.term_labels`` order (diastolic, systolic, temperature for the
+    health-care system); ``output_universe`` and ``output_mfs`` do the same
+    for the consequent. Inputs outside a universe are clipped to it, exactly
+    like ``ControlSystemSimulation(clip_to_bounds=True)``.
+
+    ``defuzzify_method`` picks how the aggregated output set is reduced:
+
+    * ``'centroid'``: numeric centroid on the output universe upsampled
+      ``upsample`` times; within ~0.02 of skfuzzy's centroid.
+    * ``'analytic'``: exact centroid of the max of clipped triangles, in
+      closed form per sample. Needs triangular output terms where only
+      neighbouring terms overlap (true for ``automf``). It integrates the
+      ideal triangles rather than their integer samples, whose peaks
+      ``automf`` places between samples. On 200k random health-care vitals
+      it is within 0.38 of ``'centroid'`` (mean 0.008) and ~11x faster.
+    * ``'weighted_average'``: Sugeno-style average of the output term
+      centroids weighted by their cuts. Fastest (~20x), but a different
+      model: on the same vitals it departs from ``'centroid'`` by up to
+      10 points (mean 0.8).
+    """
+
+    def __init__(self, tensor, universes, term_mfs, output_universe, output_mfs,
+                 upsample=20, chunk_size=2048, sparse=True, defuzzify_method='centroid',
+                 term_params=None):
+        self.tensor = tensor
+        self.universes = [np.asarray(u) for u in universes]
+        self.term_mfs = [[np.asarray(mf) for mf in mfs] for mfs in term_mfs]
+        # Optional [a, b, c] triangle corners per antecedent term; when set,
+        # inputs are fuzzified continuously instead of from term_mfs samples
+        self.term_params = None if term_params is None else [
+            [tuple(float(p) for p in corners) for corners in params] for params in term_params]
+        self.consequent_universe = np.asarray(output_universe)
+        self.consequent_mfs = [np.asarray(mf) for mf in output_mfs]
+        self.upsample = upsample
+        self.rules = None
+
+        # One membership row per antecedent term, plus a trailing row of
+        # ones that wildcard positions point to.
+        offsets = np.cumsum([0] + [len(labels) for labels in tensor.term_labels])
+        self.ones_row = offsets[-1]
+        self.rule_index = np.where(tensor.index == WILDCARD, self.ones_row, tensor.index + offsets[:-1])
+
+        universe = self.consequent_universe.astype(np.float64)
+        self.output_universe = np.linspace(universe[0], universe[-1],
+                                           (len(universe) - 1) * upsample + 1)
+        self.output_mfs = np.array([np.interp(self.output_universe, universe, mf)
+                                    for mf in self.consequent_mfs])
+        self.centroid_weights = centroid_weights(self.output_universe)
+        self.chunk_size = chunk_size
+        self.sparse = sparse
+        self._dense = None
+        self.telemetry = None
+
+        if defuzzify_method not in ('centroid', 'analytic', 'weighted_average'):
+            raise ValueError("Unknown defuzzify_method %r" % (defuzzify_method,))
+        self.defuzzify_method = defuzzify_method
+        self.term_centroids = np.array([centroid(universe, mf[None, :])[0] for mf in self.consequent_mfs])
+        if defuzzify_method == 'analytic':
+            self._init_analytic(universe)
+
+    def _init_analytic(self, universe):
+        triangles = [triangle_params(universe, mf) for mf in self.consequent_mfs]
+        if any(t is None for t in triangles):
+            raise ValueError("Analytic defuzzification needs triangular output terms")
+        order = np.argsort([b for _, b, _ in triangles])
+        tri = np.array(triangles)[order]
+        # Inclusion-exclusion over neighbours is only exact if no point is
+        # covered by three terms and each overlap is between the falling
+        # edge of one term and the rising edge of the next
+        if np.any(tri[:-2, 2] > tri[2:, 0]) or np.any(tri[:-1, 1] > tri[1:, 0]) or np.any(tri[:-1, 2] > tri[1:, 1]):
+            raise ValueError("Analytic defuzzification needs output terms that only overlap their neighbours")
+        with np.errstate(divide='ignore'):
+            self._tri_order = order
+            self._tri = tri
+            self._tri_slope_r = 1.0 / (tri[:, 1] - tri[:, 0])
+            self._tri_slope_f = 1.0 / (tri[:, 2] - tri[:, 1])
+        self._tri_bounds = (universe[0], universe[-1])
+
+    @classmethod
+    def from_rules(cls, rules, **kwargs):
+        """
+        Compiles a list of ``ctrl.Rule`` objects and builds an engine for it.
+        """
+        antecedents, consequent = rule_variables(rules)
+        tensor = RuleTensor.from_rules(rules)
+        engine = cls(tensor,
+                     [var.universe for var in antecedents],
+                     [[var.terms[label].mf for label in labels]
+                      for var, labels in zip(antecedents, tensor.term_labels)],
+                     consequent.universe,
+                     [consequent.terms[label].mf for label in tensor.output_labels],
+                     **kwargs)
+        engine.rules = list(rules)
+        return engine
+
+    @property
+    def weights(self):
+        return self.tensor.weights
+
+    def refresh_weights(self):
+        """
+        Re-reads rule weights after ``rule.weight`` has been changed in place.
+        """
+        self.tensor.weights = np.array([_rule_weight(rule) for rule in self.rules], dtype=np.float64)
+
+    def enable_telemetry(self, bins=10):
+        """
+        Starts recording stage timings and rule firing statistics in
+        ``compute`` and returns the ``InferenceTelemetry`` collecting them.
+        """
+        from telemetry import InferenceTelemetry
+        self.telemetry = InferenceTelemetry(len(self.tensor), bins)
+        return self.telemetry
+
+    def disable_telemetry(self):
+        self.telemetry = None
+
+    def fuzzify(self, *inputs):
+        """
+        Returns the (terms + 1, samples) membership matrix for the inputs.
+        """
+        n = inputs[0].shape[0]
+        memberships = np.empty((self.ones_row + 1, n), dtype=np.float64)
+        row = 0
+        for v, (universe, values) in enumerate(zip(self.universes, inputs)):
+            values = np.clip(values, universe.min(), universe.max())
+            if self.term_params is not None:
+                for a, b, c in self.term_params[v]:
+                    memberships[row] = trimf(values, a, b, c)
+                    row += 1
+            else:
+                for mf in self.term_mfs[v]:
+                    memberships[row] = np.interp(values, universe, mf)
+                    row += 1
+        memberships[self.ones_row] = 1.0
+        return memberships
+
+    def firing(self, memberships):
+        """
+        Returns the unweighted (rules, samples) firing strength of every rule.
+        """
+        return memberships[self.rule_index].min(axis=1)
+
+    def activations(self, memberships):
+        """
+        Returns the weighted (rules, samples) firing strength of every rule.
+        """
+        return self.firing(memberships) * self.tensor.weights[:, None]
+
+    def cuts(self, activations):
+        """
+        Returns the (output terms, samples) accumulated cut of each output term.
+        """
+        cuts = np.zeros((len(self.tensor.output_labels), activations.shape[1]))
+        for k in range(len(cuts)):
+            fired = activations[self.tensor.consequent == k]
+            if len(fired):
+                cuts[k] = fired.max(axis=0)
+        return cuts
+
+    def dense_rules(self):
+        """
+        Returns ``tensor.dense()`` with empty cells pointed at output term 0
+        with weight 0, rebuilt whenever the rule weights change.
+        """
+        weights = self.tensor.weights
+        if self._dense is None or not np.array_equal(self._dense[0], weights):
+            consequent, dense_weights = self.tensor.dense()
+            empty = consequent == WILDCARD
+            consequent[empty] = 0
+            dense_weights[empty] = 0.0
+            # Wildcard patterns (which variables are left out) that have rules
+            patterns = sorted({tuple(row) for row in self.tensor.wildcard.tolist()})
+            self._dense = (weights.copy(), consequent, dense_weights, patterns)
+        return self._dense[1:]
+
+    def sparse_cuts(self, memberships):
+        """
+        Same result as ``cuts(activations(memberships))``, but only looks at
+        rules whose antecedent terms are all active.
+
+        Overlapping triangles leave at most a couple of non-zero terms per
+        variable, so each sample is expanded into those term combinations
+        (plus wildcard slots) and the matching rules are looked up in the
+        dense rule tensor, instead of firing every rule.
+        """
+        consequent, weights, patterns = self.dense_rules()
+        n = memberships.shape[1]
+        samples = np.arange(n)
+        top_index = []
+        top_value = []
+        row = 0
+        for labels in self.tensor.term_labels:
+            block = memberships[row:row + len(labels)]
+            row += len(labels)
+            k = max(1, int((block > 0).sum(axis=0).max()))
+            index = np.argsort(-block, axis=0, kind='stable')[:k]
+            top_index.append(index)
+            top_value.append(np.take_along_axis(block, index, axis=0))
+
+        cuts = np.zeros((len(self.tensor.output_labels), n))
+        for pattern in patterns:
+            choices = [[None] if wild else range(len(index))
+                       for wild, index in zip(pattern, top_index)]
+            for combo in np.ndindex(*[len(c) for c in choices]):
+                cell = []
+                strength = np.ones(n)
+                for v, (wild, pick) in enumerate(zip(pattern, combo)):
+                    if wild:
+                        cell.append(len(self.tensor.term_labels[v]))
+                    else:
+                        cell.append(top_index[v][pick])
+                        strength = np.minimum(strength, top_value[v][pick])
+                cell = tuple(cell)
+                for layer_consequent, layer_weights in zip(consequent, weights):
+                    out_term = layer_consequent[cell]
+                    activation = strength * layer_weights[cell]
+                    cuts[out_term, samples] = np.maximum(cuts[out_term, samples], activation)
+        return cuts
+
+    def defuzzify(self, cuts):
+        """
+        Returns the crisp output for each column of ``cuts``, using the
+        engine's ``defuzzify_method``.
+        """
+        if self.defuzzify_method == 'analytic':
+            return self.defuzzify_analytic(cuts)
+        if self.defuzzify_method == 'weighted_average':
+            return self.defuzzify_weighted_average(cuts)
+        aggregated = np.minimum(cuts[0][:, None], self.output_mfs[0])
+        for k in range(1, len(cuts)):
+            np.maximum(aggregated, np.minimum(cuts[k][:, None], self.output_mfs[k]), aggregated)
+        return centroid(self.output_universe, aggregated, self.centroid_weights)
+
+    def defuzzify_analytic(self, cuts):
+        """
+        Returns the exact centroid of the max of the clipped output triangles.
+
+        Only neighbouring triangles overlap, so the area (and moment) of the
+        union is the sum over clipped triangles minus the sum over the
+        overlaps of neighbours, each a closed-form trapezoid.
+        """
+        lo, hi = self._tri_bounds
+        tri, slope_r, slope_f = self._tri, self._tri_slope_r, self._tri_slope_f
+        cuts = np.clip(cuts[self._tri_order], 0.0, 1.0)
+        area = np.zeros(cuts.shape[1])
+        moment = np.zeros(cuts.shape[1])
+        for k in range(len(tri)):
+            a, m = _plateau_moments(tri[k, 0], tri[k, 2], slope_r[k], slope_f[k], cuts[k], lo, hi)
+            area += a
+            moment += m
+        for k in range(len(tri) - 1):
+            # Overlap of the falling edge of k and the rising edge of k + 1
+            start, stop = tri[k + 1, 0], tri[k, 2]
+            if stop <= start:
+                continue
+            peak = slope_r[k + 1] * slope_f[k] * (stop - start) / (slope_r[k + 1] + slope_f[k])
+            cap = np.minimum(np.minimum(cuts[k], cuts[k + 1]), peak)
+            a, m = _plateau_moments(start, stop, slope_r[k + 1], slope_f[k], cap, lo, hi)
+            area -= a
+            moment -= m
+        with np.errstate(invalid='ignore', divide='ignore'):
+            return np.where(area > 1e-12, moment / area, np.nan)
+
+    def defuzzify_weighted_average(self, cuts):
+        """
+        Returns the average of the output term centroids weighted by their
+        cuts (zero-order Sugeno approximation of the centroid).
+        """
+        total = cuts.sum(axis=0)
+        with np.errstate(invalid='ignore', divide='ignore'):
+            return np.where(total > 0, self.term_centroids @ cuts / total, np.nan)
+
+    def compute_weighted(self, firing, weights):
+        """
+        Returns the crisp outputs for precomputed ``firing`` strengths under
+        a different weight vector, without re-fuzzifying the inputs.
+        """
+        weights = np.asarray(weights, dtype=np.float64)[:, None]
+        out = np.empty(firing.shape[1], dtype=np.float64)
+        for start in range(0, len(out), self.chunk_size):
+            stop = start + self.chunk_size
+            out[start:stop] = self.defuzzify(self.cuts(firing[:, start:stop] * weights))
+        return out
+
+    def _flatten(self, inputs):
+        if len(inputs) != len(self.universes):
+            raise ValueError("Expected %d input arrays, got %d" % (len(self.universes), len(inputs)))
+        inputs = np.broadcast_arrays(*[np.asarray(x, dtype=np.float64) for x in inputs])
+        return inputs[0].shape, [x.ravel() for x in inputs]
+
+    def fire(self, *inputs):
+        """
+        Returns the unweighted (rules, samples) firing strengths for arrays
+        of inputs, for reuse with ``compute_weighted``.
+        """
+        _, flat = self._flatten(inputs)
+        firing = np.empty((len(self.tensor), flat[0].shape[0]), dtype=np.float64)
+        for start in range(0, firing.shape[1], self.chunk_size):
+            chunk = [x[start:start + self.chunk_size] for x in flat]
+            firing[:, start:start + self.chunk_size] = self.firing(self.fuzzify(*chunk))
+        return firing
+
+    def compute(self, *inputs):
+        """
+        Returns the crisp output for arrays of inputs, one per antecedent.
+
+        Samples for which no rule fires come back as NaN (skfuzzy raises
+        for those instead).
+        """
+        shape, flat = self._flatten(inputs)
+        out = np.empty(flat[0].shape[0], dtype=np.float64)
+        if self.telemetry is not None:
+            self._compute_profiled(flat, out, self.telemetry)
+            return out.reshape(shape)
+        for start in range(0, len(out), self.chunk_size):
+            chunk = [x[start:start + self.chunk_size] for x in flat]
+            memberships = self.fuzzify(*chunk)
+            if self.sparse:
+                cuts = self.sparse_cuts(memberships)
+            else:
+                cuts = self.cuts(self.activations(memberships))
+            out[start:start + self.chunk_size] = self.defuzzify(cuts)
+        return out.reshape(shape)
+
+    def _compute_profiled(self, flat, out, telemetry):
+        telemetry.record_call(len(out))
+        for start in range(0, len(out), self.chunk_size):
+            chunk = [x[start:start + self.chunk_size] for x in flat]
+            with telemetry.stage('fuzzify'):
+                memberships = self.fuzzify(*chunk)
+            if self.sparse:
+                with telemetry.stage('rules'):
+                    cuts = self.sparse_cuts(memberships)
+                with telemetry.stage('telemetry'):
+                    telemetry.record_firing(self.firing(memberships))
+            else:
+                with telemetry.stage('rules'):
+                    firing = self.firing(memberships)
+                with telemetry.stage('aggregate'):
+                    cuts = self.cuts(firing * self.tensor.weights[:, None])
+                with telemetry.stage('telemetry'):
+                    telemetry.record_firing(firing)
+            with telemetry.stage('defuzzify'):
+                out[start:start + self.chunk_size] = self.defuzzify(cuts)
+
+
+def batch_compute(rules, diastolic, systolic, temperature):
+    """
+    Returns the crisp Health Care score for arrays of vitals.
+    """
+    return BatchInference.from_rules(rules).compute(diastolic, systolic, temperature)
+
+
+def with_duplicate_antecedents(engine, every=3):
+    """
+    Returns a copy of ``engine`` whose rule base repeats every ``every``-th
+    rule twice: once with the next output term and once at half weight.
+    """
+    tensor = engine.tensor
+    picked = np.arange(0, len(tensor), every)
+    other = (tensor.consequent[picked] + 1) % len(tensor.output_labels)
+    duplicated = RuleTensor(tensor.variables, tensor.term_labels, tensor.output_label, tensor.output_labels,
+                            np.concatenate([tensor.index, tensor.index[picked], tensor.index[picked]]),
+                            np.concatenate([tensor.consequent, other, tensor.consequent[picked]]),
+                            np.concatenate([tensor.weights, tensor.weights[picked], tensor.weights[picked] / 2]))
+    return BatchInference(duplicated, engine.universes, engine.term_mfs, engine.consequent_universe,
+                          engine.consequent_mfs, upsample=engine.upsample, chunk_size=engine.chunk_size,
+                          defuzzify_method=engine.defuzzify_method, term_params=engine.term_params)
+
+
+def check_sparse(engine, samples=1000, seed=0):
+    """
+    Scores random inputs with the sparse and the dense path and raises
+    AssertionError unless they agree, on the engine's rules and on the
+    same rules with duplicated antecedents added.
+    """
+    rng = np.random.default_rng(seed)
+    inputs = [rng.uniform(universe.min(), universe.max(), samples) for universe in engine.universes]
+    for checked in (engine, with_duplicate_antecedents(engine)):
+        sparse = checked.sparse
+        try:
+            checked.sparse = True
+            fast = checked.compute(*inputs)
+            checked.sparse = False
+            full = checked.compute(*inputs)
+        finally:
+            checked.sparse = sparse
+        assert np.allclose(fast, full, equal_nan=True), \
+            "sparse and dense outputs differ by up to %g" % np.nanmax(np.abs(fast - full))
+
+
+class FiringCache:
+    """
+    Rule firing for a fixed set of input cases, reused across weight vectors.
+
+    Fuzzification and rule firing do not depend on rule weights, so they
+    are computed once. Only the non-zero (rule, case) firings are kept,
+    pre-sorted by (output term, case); scoring a weight vector is then a
+    scaled segmented max over those entries followed by defuzzification.
+    """
+
+    def __init__(self, engine, *inputs):
+        self.engine = engine
+        firing = engine.fire(*inputs)
+        self.cases = firing.shape[1]
+        rule, case = np.nonzero(firing)
+        cell = engine.tensor.consequent[rule] * self.cases + case
+        order = np.argsort(cell, kind='stable')
+        self.rule = rule[order]
+        self.strength = firing[rule[order], case[order]]
+        cell = cell[order]
+        self.starts = np.flatnonzero(np.r_[True, cell[1:] != cell[:-1]]) if len(cell) else np.array([], dtype=np.intp)
+        self.cells = cell[self.starts]
+
+    def cuts(self, weights):
+        """
+        Returns the (output terms, cases) cuts under ``weights``.
+        """
+        cuts = np.zeros((len(self.engine.tensor.output_labels), self.cases))
+        if len(self.starts):
+            activation = self.strength * np.asarray(weights, dtype=np.float64)[self.rule]
+            cuts.flat[self.cells] = np.maximum.reduceat(activation, self.starts)
+        return cuts
+
+    def compute(self, weights):
+        """
+        Returns the crisp output of every cached case under ``weights``.
+        """
+        cuts = self.cuts(weights)
+        out = np.empty(self.cases, dtype=np.float64)
+        chunk_size = self.engine.chunk_size
+        for start in range(0, self.cases, chunk_size):
+            out[start:start + chunk_size] = self.engine.defuzzify(cuts[:, start:start + chunk_size])
+        return out
+
+
+if __name__ == '__main__':
+    from health_care import health_care_engine
+
+    check_sparse(health_care_engine)
+    print("Sparse and dense inference agree")
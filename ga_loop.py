@@ -0,0 +1,135 @@
+"""
+(mu + lambda) evolution loop with checkpointing and early stopping.
+
+Runs the same generations as ``algorithms.eaMuPlusLambda`` (so a seeded
+run gives the same population), and additionally:
+
+* pickles population, hall of fame, logbook and ``random`` state to
+  ``checkpoint_path`` every ``checkpoint_every`` generations, and picks a
+  run back up from that file;
+* stops once the best fitness has not improved by more than ``min_delta``
+  for ``patience`` generations;
+* records the wall time of every generation next to the fitness stats.
+"""
+import os
+import pickle
+import random
+import time
+
+import numpy as np
+from deap import algorithms, tools
+
+CHECKPOINT_VERSION = 1
+
+
+def fitness_stats():
+    """
+    Returns a ``tools.Statistics`` of avg/std/min/max fitness.
+    """
+    stats = tools.Statistics(lambda ind: ind.fitness.values[0])
+    stats.register("avg", np.mean)
+    stats.register("std", np.std)
+    stats.register("min", np.min)
+    stats.register("max", np.max)
+    return stats
+
+
+def save_checkpoint(path, state):
+    """
+    Writes ``state`` to ``path`` atomically, so a run killed mid-write
+    leaves the previous checkpoint intact.
+    """
+    tmp = path + '.tmp'
+    with open(tmp, 'wb') as f:
+        pickle.dump(dict(state, version=CHECKPOINT_VERSION), f)
+    os.replace(tmp, path)
+
+
+def load_checkpoint(path):
+    with open(path, 'rb') as f:
+        state = pickle.load(f)
+    if state.get('version') != CHECKPOINT_VERSION:
+        raise ValueError("%s is not a version %d GA checkpoint" % (path, CHECKPOINT_VERSION))
+    return state
+
+
+def _evaluate(population, toolbox):
+    invalid = [ind for ind in population if not ind.fitness.valid]
+    for ind, fit in zip(invalid, toolbox.map(toolbox.evaluate, invalid)):
+        ind.fitness.values = fit
+    return len(invalid)
+
+
+def evolve(population, toolbox, mu, lambda_, cxpb, mutpb, ngen, halloffame=None, stats=None,
+           checkpoint_path=None, checkpoint_every=1, patience=None, min_delta=0.0, verbose=True):
+    """
+    Evolves ``population`` in place and returns (population, logbook).
+
+    If ``checkpoint_path`` exists the run resumes from it and
+    ``population``/``halloffame`` are overwritten with the saved ones;
+    the ``random`` state is restored too, so a resumed seeded run ends the
+    same as an uninterrupted one. The final generation is always
+    checkpointed, early stop included.
+    """
+    if checkpoint_path is not None and os.path.exists(checkpoint_path):
+        state = load_checkpoint(checkpoint_path)
+        population[:] = state['population']
+        if halloffame is not None:
+            halloffame.clear()
+            halloffame.update(state['halloffame'])
+        logbook = state['logbook']
+        start_gen = state['generation'] + 1
+        best, stale = state['best'], state['stale']
+        random.setstate(state['rndstate'])
+        if verbose:
+            print("Resumed from %s at generation %d" % (checkpoint_path, state['generation']))
+    else:
+        logbook = tools.Logbook()
+        logbook.header = ['gen', 'nevals', 'seconds'] + (stats.fields if stats else [])
+        start = time.perf_counter()
+        nevals = _evaluate(population, toolbox)
+        if halloffame is not None:
+            halloffame.update(population)
+        record = stats.compile(population) if stats else {}
+        logbook.record(gen=0, nevals=nevals, seconds=time.perf_counter() - start, **record)
+        if verbose:
+            print(logbook.stream)
+        start_gen = 1
+        best = max(ind.fitness.values[0] for ind in population)
+        stale = 0
+
+    for gen in range(start_gen, ngen + 1):
+        if patience is not None and stale >= patience:
+            break
+        start = time.perf_counter()
+        offspring = algorithms.varOr(population, toolbox, lambda_, cxpb, mutpb)
+        nevals = _evaluate(offspring, toolbox)
+        if halloffame is not None:
+            halloffame.update(offspring)
+        population[:] = toolbox.select(population + offspring, mu)
+
+        record = stats.compile(population) if stats else {}
+        logbook.record(gen=gen, nevals=nevals, seconds=time.perf_counter() - start, **record)
+        if verbose:
+            print(logbook.stream)
+
+        generation_best = max(ind.fitness.values[0] for ind in population)
+        if generation_best > best + min_delta:
+            best, stale = generation_best, 0
+        else:
+            best, stale = max(best, generation_best), stale + 1
+
+        done = gen == ngen or (patience is not None and stale >= patience)
+        if checkpoint_path is not None and (done or gen % checkpoint_every == 0):
+            save_checkpoint(checkpoint_path, {
+                'population': population,
+                'halloffame': list(halloffame) if halloffame is not None else [],
+                'logbook': logbook,
+                'generation': gen,
+                'best': best,
+                'stale': stale,
+                'rndstate': random.getstate(),
+            })
+        if verbose and patience is not None and stale >= patience:
+            print("No improvement for %d generations, stopping at generation %d" % (stale, gen))
+    return population, logbook
@@ -0,0 +1,328 @@
+"""
+Health-care fuzzy model: vitals antecedents, Health Care consequent and rules.
+
+Importing this module only builds the fuzzy variables, the rule list and the
+compiled batch engine; none of the repo's plotting, GUI or GA code is loaded
+(``skfuzzy.control`` itself still imports ``matplotlib.pyplot``). The
+skfuzzy ``ControlSystem``, which takes seconds to link, is only built the
+first time ``health_care_system`` is accessed.
+
+Run it directly to measure cold-start import time against the budget:
+
+    python health_care.py
+"""
+import numpy as np
+import skfuzzy as fuzz
+from skfuzzy import control as ctrl
+
+from fuzzy_engine import BatchInference
+
+# Cold-start budget for `import health_care` in a fresh interpreter
+IMPORT_BUDGET_SECONDS = 2.0
+
+Diastolic_BP=ctrl.Antecedent(np.arange(40, 140, 1), label="Diastolic Blood Pressure")
+Systolic_BP=ctrl.Antecedent(np.arange(70, 200, 1), label="Systolic Blood Pressure")
+Temperature=ctrl.Antecedent(np.arange(98, 108, 1), label="Temperature")
+Health_care=ctrl.Consequent(np.arange(0,100,1),label="Health Care",defuzzify_method="centroid")
+
+
+# Triangle corners [a, b, c] of every antecedent term
+diastolic_terms = {
+    'Low': [40, 55, 70],
+    'Normal': [60, 72, 85],
+    'Pre Hypertension': [80, 87, 95],
+    'High BP Stage 1': [90, 97, 105],
+    'High BP Stage 2': [100, 115, 125],
+    'Emergency': [120, 130, 150],
+}
+systolic_terms = {
+    'Low': [70, 85, 100],
+    'Normal': [90, 110, 130],
+    'Pre Hypertension': [120, 135, 150],
+    'High BP Stage 1': [140, 155, 170],
+    'High BP Stage 2': [160, 175, 190],
+    'Emergency': [180, 200, 220],
+}
+temperature_terms = {
+    'Low': [94, 96, 98],
+    'Temp': [96, 98, 102],
+    'Temp High 1': [98, 104, 106],
+    'Temp High 2': [104, 106, 108],
+    'Emergency': [106, 108, 110],
+}
+
+for label, corners in diastolic_terms.items():
+    Diastolic_BP[label]=fuzz.trimf(Diastolic_BP.universe, corners)
+for label, corners in systolic_terms.items():
+    Systolic_BP[label]=fuzz.trimf(Systolic_BP.universe, corners)
+for label, corners in temperature_terms.items():
+    Temperature[label]=fuzz.trimf(Temperature.universe, corners)
+
+Health_care.automf(5,names=['Good','Normal','Worst','Dangerous','High Emergency'])
+
+diastolic_labels = ['Low', 'Normal', 'Pre Hypertension', 'High BP Stage 1', 'High BP Stage 2', 'Emergency']
+systolic_labels = ['Low', 'Normal', 'Pre Hypertension', 'High BP Stage 1', 'High BP Stage 2', 'Emergency']
+temperature_labels = ['Low', 'Temp', 'Temp High 1', 'Temp High 2', 'Emergency']
+health_care_labels = ['Good', 'Normal', 'Worst','Dangerous','High Emergency']
+
+
+rules = []
+
+rules.append(ctrl.Rule(Diastolic_BP["Low"] & Systolic_BP["Low"] & Temperature["Low"] ,Health_care["Dangerous"]))
+rules.append(ctrl.Rule(Diastolic_BP["Low"] & Systolic_BP["Low"] & Temperature["Temp"] ,Health_care["Worst"]))
+rules.append(ctrl.Rule(Diastolic_BP["Low"] & Systolic_BP["Low"] & Temperature["Temp High 1"] ,Health_care["Worst"]))
+rules.append(ctrl.Rule(Diastolic_BP["Low"] & Systolic_BP["Low"] & Temperature["Temp High 2"] ,Health_care["Worst"]))
+rules.append(ctrl.Rule(Diastolic_BP["Low"] & Systolic_BP["Low"] & Temperature["Emergency"] ,Health_care["Worst"]))
+rules.append(ctrl.Rule(Diastolic_BP["Low"] & Systolic_BP["Normal"] & Temperature["Low"] ,Health_care["Normal"]))
+rules.append(ctrl.Rule(Diastolic_BP["Low"] & Systolic_BP["Normal"] & Temperature["Temp"] ,Health_care["Normal"]))
+rules.append(ctrl.Rule(Diastolic_BP["Low"] & Systolic_BP["Normal"] & Temperature["Temp High 1"] ,Health_care["Normal"]))
+rules.append(ctrl.Rule(Diastolic_BP["Low"] & Systolic_BP["Normal"] & Temperature["Temp High 2"] ,Health_care["Normal"]))
+rules.append(ctrl.Rule(Diastolic_BP["Low"] & Systolic_BP["Normal"] & Temperature["Emergency"] ,Health_care["Worst"]))
+rules.append(ctrl.Rule(Diastolic_BP["Low"] & Systolic_BP["Pre Hypertension"] & Temperature["Low"] ,Health_care["Normal"]))
+rules.append(ctrl.Rule(Diastolic_BP["Low"] & Systolic_BP["Pre Hypertension"] & Temperature["Temp"] ,Health_care["Normal"]))
+rules.append(ctrl.Rule(Diastolic_BP["Low"] & Systolic_BP["Pre Hypertension"] & Temperature["Temp High 1"] ,Health_care["Normal"]))
+rules.append(ctrl.Rule(Diastolic_BP["Low"] & Systolic_BP["Pre Hypertension"] & Temperature["Temp High 2"] ,Health_care["Normal"]))
+rules.append(ctrl.Rule(Diastolic_BP["Low"] & Systolic_BP["Pre Hypertension"] & Temperature["Emergency"] ,Health_care["Worst"]))
+rules.append(ctrl.Rule(Diastolic_BP["Low"] & Systolic_BP["High BP Stage 1"] & Temperature["Low"] ,Health_care["Normal"]))
+rules.append(ctrl.Rule(Diastolic_BP["Low"] & Systolic_BP["High BP Stage 1"] & Temperature["Temp"] ,Health_care["Normal"]))
+rules.append(ctrl.Rule(Diastolic_BP["Low"] & Systolic_BP["High BP Stage 1"] & Temperature["Temp High 1"] ,Health_care["Normal"]))
+rules.append(ctrl.Rule(Diastolic_BP["Low"] & Systolic_BP["High BP Stage 1"] & Temperature["Temp High 2"] ,Health_care["Normal"]))
+rules.append(ctrl.Rule(Diastolic_BP["Low"] & Systolic_BP["High BP Stage 1"] & Temperature["Emergency"] ,Health_care["Dangerous"]))
+rules.append(ctrl.Rule(Diastolic_BP["Low"] & Systolic_BP["High BP Stage 2"] & Temperature["Low"] ,Health_care["Worst"]))
+rules.append(ctrl.Rule(Diastolic_BP["Low"] & Systolic_BP["High BP Stage 2"] & Temperature["Temp"] ,Health_care["Worst"]))
+rules.append(ctrl.Rule(Diastolic_BP["Low"] & Systolic_BP["High BP Stage 2"] & Temperature["Temp High 1"] ,Health_care["Worst"]))
+rules.append(ctrl.Rule(Diastolic_BP["Low"] & Systolic_BP["High BP Stage 2"] & Temperature["Temp High 2"] ,Health_care["Worst"]))
+rules.append(ctrl.Rule(Diastolic_BP["Low"] & Systolic_BP["High BP Stage 2"] & Temperature["Emergency"] ,Health_care["Dangerous"]))
+rules.append(ctrl.Rule(Diastolic_BP["Low"] & Systolic_BP["Emergency"] & Temperature["Low"] ,Health_care["Worst"]))
+rules.append(ctrl.Rule(Diastolic_BP["Low"] & Systolic_BP["Emergency"] & Temperature["Temp"] ,Health_care["Worst"]))
+rules.append(ctrl.Rule(Diastolic_BP["Low"] & Systolic_BP["Emergency"] & Temperature["Temp High 1"] ,Health_care["Worst"]))
+rules.append(ctrl.Rule(Diastolic_BP["Low"] & Systolic_BP["Emergency"] & Temperature["Temp High 2"] ,Health_care["Dangerous"]))
+rules.append(ctrl.Rule(Diastolic_BP["Low"] & Systolic_BP["Emergency"] & Temperature["Emergency"] ,Health_care["High Emergency"]))
+rules.append(ctrl.Rule(Diastolic_BP["Normal"] & Systolic_BP["Low"] & Temperature["Low"] ,Health_care["Good"]))
+rules.append(ctrl.Rule(Diastolic_BP["Normal"] & Systolic_BP["Low"] & Temperature["Temp"] ,Health_care["Good"]))
+rules.append(ctrl.Rule(Diastolic_BP["Normal"] & Systolic_BP["Low"] & Temperature["Temp High 1"] ,Health_care["Normal"]))
+rules.append(ctrl.Rule(Diastolic_BP["Normal"] & Systolic_BP["Low"] & Temperature["Temp High 2"] ,Health_care["Normal"]))
+rules.append(ctrl.Rule(Diastolic_BP["Normal"] & Systolic_BP["Low"] & Temperature["Emergency"] ,Health_care["Worst"]))
+rules.append(ctrl.Rule(Diastolic_BP["Normal"] & Systolic_BP["Normal"] & Temperature["Low"] ,Health_care["Good"]))
+rules.append(ctrl.Rule(Diastolic_BP["Normal"] & Systolic_BP["Normal"] & Temperature["Temp"] ,Health_care["Good"]))
+rules.append(ctrl.Rule(Diastolic_BP["Normal"] & Systolic_BP["Normal"] & Temperature["Temp High 1"] ,Health_care["Normal"]))
+rules.append(ctrl.Rule(Diastolic_BP["Normal"] & Systolic_BP["Normal"] & Temperature["Temp High 2"] ,Health_care["Normal"]))
+rules.append(ctrl.Rule(Diastolic_BP["Normal"] & Systolic_BP["Normal"] & Temperature["Emergency"] ,Health_care["Worst"]))
+rules.append(ctrl.Rule(Diastolic_BP["Normal"] & Systolic_BP["Pre Hypertension"] & Temperature["Low"] ,Health_care["Normal"]))
+rules.append(ctrl.Rule(Diastolic_BP["Normal"] & Systolic_BP["Pre Hypertension"] & Temperature["Temp"] ,Health_care["Normal"]))
+rules.append(ctrl.Rule(Diastolic_BP["Normal"] & Systolic_BP["Pre Hypertension"] & Temperature["Temp High 1"] ,Health_care["Normal"]))
+rules.append(ctrl.Rule(Diastolic_BP["Normal"] & Systolic_BP["Pre Hypertension"] & Temperature["Temp High 2"] ,Health_care["Worst"]))
+rules.append(ctrl.Rule(Diastolic_BP["Normal"] & Systolic_BP["Pre Hypertension"] & Temperature["Emergency"] ,Health_care["Worst"]))
+rules.append(ctrl.Rule(Diastolic_BP["Normal"] & Systolic_BP["High BP Stage 1"] & Temperature["Low"] ,Health_care["Normal"]))
+rules.append(ctrl.Rule(Diastolic_BP["Normal"] & Systolic_BP["High BP Stage 1"] & Temperature["Temp"] ,Health_care["Normal"]))
+rules.append(ctrl.Rule(Diastolic_BP["Normal"] & Systolic_BP["High BP Stage 1"] & Temperature["Temp High 1"] ,Health_care["Normal"]))
+rules.append(ctrl.Rule(Diastolic_BP["Normal"] & Systolic_BP["High BP Stage 1"] & Temperature["Temp High 2"] ,Health_care["Worst"]))
+rules.append(ctrl.Rule(Diastolic_BP["Normal"] & Systolic_BP["High BP Stage 1"] & Temperature["Emergency"] ,Health_care["Dangerous"]))
+rules.append(ctrl.Rule(Diastolic_BP["Normal"] & Systolic_BP["High BP Stage 2"] & Temperature["Low"] ,Health_care["Worst"]))
+rules.append(ctrl.Rule(Diastolic_BP["Normal"] & Systolic_BP["High BP Stage 2"] & Temperature["Temp"] ,Health_care["Worst"]))
+rules.append(ctrl.Rule(Diastolic_BP["Normal"] & Systolic_BP["High BP Stage 2"] & Temperature["Temp High 1"] ,Health_care["Worst"]))
+rules.append(ctrl.Rule(Diastolic_BP["Normal"] & Systolic_BP["High BP Stage 2"] & Temperature["Temp High 2"] ,Health_care["Dangerous"]))
+rules.append(ctrl.Rule(Diastolic_BP["Normal"] & Systolic_BP["High BP Stage 2"] & Temperature["Emergency"] ,Health_care["Dangerous"]))
+rules.append(ctrl.Rule(Diastolic_BP["Normal"] & Systolic_BP["Emergency"] & Temperature["Low"] ,Health_care["Worst"]))
+rules.append(ctrl.Rule(Diastolic_BP["Normal"] & Systolic_BP["Emergency"] & Temperature["Temp"] ,Health_care["Worst"]))
+rules.append(ctrl.Rule(Diastolic_BP["Normal"] & Systolic_BP["Emergency"] & Temperature["Temp High 1"] ,Health_care["Dangerous"]))
+rules.append(ctrl.Rule(Diastolic_BP["Normal"] & Systolic_BP["Emergency"] & Temperature["Temp High 2"] ,Health_care["Dangerous"]))
+rules.append(ctrl.Rule(Diastolic_BP["Normal"] & Systolic_BP["Emergency"] & Temperature["Emergency"] ,Health_care["High Emergency"]))
+rules.append(ctrl.Rule(Diastolic_BP["Pre Hypertension"] & Systolic_BP["Low"] & Temperature["Low"] ,Health_care["Normal"]))
+rules.append(ctrl.Rule(Diastolic_BP["Pre Hypertension"] & Systolic_BP["Low"] & Temperature["Temp"] ,Health_care["Normal"]))
+rules.append(ctrl.Rule(Diastolic_BP["Pre Hypertension"] & Systolic_BP["Low"] & Temperature["Temp High 1"] ,Health_care["Normal"]))
+rules.append(ctrl.Rule(Diastolic_BP["Pre Hypertension"] & Systolic_BP["Low"] & Temperature["Temp High 2"] ,Health_care["Worst"]))
+rules.append(ctrl.Rule(Diastolic_BP["Pre Hypertension"] & Systolic_BP["Low"] & Temperature["Emergency"] ,Health_care["Dangerous"]))
+rules.append(ctrl.Rule(Diastolic_BP["Pre Hypertension"] & Systolic_BP["Normal"] & Temperature["Low"] ,Health_care["Normal"]))
+rules.append(ctrl.Rule(Diastolic_BP["Pre Hypertension"] & Systolic_BP["Normal"] & Temperature["Temp"] ,Health_care["Normal"]))
+rules.append(ctrl.Rule(Diastolic_BP["Pre Hypertension"] & Systolic_BP["Normal"] & Temperature["Temp High 1"] ,Health_care["Normal"]))
+rules.append(ctrl.Rule(Diastolic_BP["Pre Hypertension"] & Systolic_BP["Normal"] & Temperature["Temp High 2"] ,Health_care["Worst"]))
+rules.append(ctrl.Rule(Diastolic_BP["Pre Hypertension"] & Systolic_BP["Normal"] & Temperature["Emergency"] ,Health_care["Worst"]))
+rules.append(ctrl.Rule(Diastolic_BP["Pre Hypertension"] & Systolic_BP["Pre Hypertension"] & Temperature["Low"] ,Health_care["Normal"]))
+rules.append(ctrl.Rule(Diastolic_BP["Pre Hypertension"] & Systolic_BP["Pre Hypertension"] & Temperature["Temp"] ,Health_care["Normal"]))
+rules.append(ctrl.Rule(Diastolic_BP["Pre Hypertension"] & Systolic_BP["Pre Hypertension"] & Temperature["Temp High 1"] ,Health_care["Normal"]))
+rules.append(ctrl.Rule(Diastolic_BP["Pre Hypertension"] & Systolic_BP["Pre Hypertension"] & Temperature["Temp High 2"] ,Health_care["Worst"]))
+rules.append(ctrl.Rule(Diastolic_BP["Pre Hypertension"] & Systolic_BP["Pre Hypertension"] & Temperature["Emergency"] ,Health_care["Worst"]))
+rules.append(ctrl.Rule(Diastolic_BP["Pre Hypertension"] & Systolic_BP["High BP Stage 1"] & Temperature["Low"] ,Health_care["Worst"]))
+rules.append(ctrl.Rule(Diastolic_BP["Pre Hypertension"] & Systolic_BP["High BP Stage 1"] & Temperature["Temp"] ,Health_care["Worst"]))
+rules.append(ctrl.Rule(Diastolic_BP["Pre Hypertension"] & Systolic_BP["High BP Stage 1"] & Temperature["Temp High 1"] ,Health_care["Worst"]))
+rules.append(ctrl.Rule(Diastolic_BP["Pre Hypertension"] & Systolic_BP["High BP Stage 1"] & Temperature["Temp High 2"] ,Health_care["Worst"]))
+rules.append(ctrl.Rule(Diastolic_BP["Pre Hypertension"] & Systolic_BP["High BP Stage 1"] & Temperature["Emergency"] ,Health_care["Dangerous"]))
+rules.append(ctrl.Rule(Diastolic_BP["Pre Hypertension"] & Systolic_BP["High BP Stage 2"] & Temperature["Low"] ,Health_care["Worst"]))
+rules.append(ctrl.Rule(Diastolic_BP["Pre Hypertension"] & Systolic_BP["High BP Stage 2"] & Temperature["Temp"] ,Health_care["Worst"]))
+rules.append(ctrl.Rule(Diastolic_BP["Pre Hypertension"] & Systolic_BP["High BP Stage 2"] & Temperature["Temp High 1"] ,Health_care["Worst"]))
+rules.append(ctrl.Rule(Diastolic_BP["Pre Hypertension"] & Systolic_BP["High BP Stage 2"] & Temperature["Temp High 2"] ,Health_care["Dangerous"]))
+rules.append(ctrl.Rule(Diastolic_BP["Pre Hypertension"] & Systolic_BP["High BP Stage 2"] & Temperature["Emergency"] ,Health_care["Dangerous"]))
+'''rules.append(ctrl.Rule(Diastolic_BP["Pre Hypertension"] & Systolic_BP["Emergency"] & Temperature["Low"] ,Health_care["Dangerous"]))
+rules.append(ctrl.Rule(Diastolic_BP["Pre Hypertension"] & Systolic_BP["Emergency"] & Temperature["Temp"] ,Health_care["Dangerous"]))
+rules.append(ctrl.Rule(Diastolic_BP["Pre Hypertension"] & Systolic_BP["Emergency"] & Temperature["Temp High 1"] ,Health_care["Dangerous"]))'''
+rules.append(ctrl.Rule(Diastolic_BP["Pre Hypertension"] & Systolic_BP["Emergency"] ,Health_care["Dangerous"]))
+rules.append(ctrl.Rule(Diastolic_BP["Pre Hypertension"] & Systolic_BP["Emergency"] & Temperature["Emergency"] ,Health_care["High Emergency"]))
+rules.append(ctrl.Rule(Diastolic_BP["High BP Stage 1"] & Systolic_BP["Low"] & Temperature["Low"] ,Health_care["Normal"]))
+rules.append(ctrl.Rule(Diastolic_BP["High BP Stage 1"] & Systolic_BP["Low"] & Temperature["Temp"] ,Health_care["Normal"]))
+rules.append(ctrl.Rule(Diastolic_BP["High BP Stage 1"] & Systolic_BP["Low"] & Temperature["Temp High 1"] ,Health_care["Normal"]))
+rules.append(ctrl.Rule(Diastolic_BP["High BP Stage 1"] & Systolic_BP["Low"] & Temperature["Temp High 2"] ,Health_care["Worst"]))
+rules.append(ctrl.Rule(Diastolic_BP["High BP Stage 1"] & Systolic_BP["Low"] & Temperature["Emergency"] ,Health_care["Dangerous"]))
+rules.append(ctrl.Rule(Diastolic_BP["High BP Stage 1"] & Systolic_BP["Normal"] & Temperature["Low"] ,Health_care["Normal"]))
+rules.append(ctrl.Rule(Diastolic_BP["High BP Stage 1"] & Systolic_BP["Normal"] & Temperature["Temp"] ,Health_care["Normal"]))
+rules.append(ctrl.Rule(Diastolic_BP["High BP Stage 1"] & Systolic_BP["Normal"] & Temperature["Temp High 1"] ,Health_care["Normal"]))
+rules.append(ctrl.Rule(Diastolic_BP["High BP Stage 1"] & Systolic_BP["Normal"] & Temperature["Temp High 2"] ,Health_care["Worst"]))
+rules.append(ctrl.Rule(Diastolic_BP["High BP Stage 1"] & Systolic_BP["Normal"] & Temperature["Emergency"] ,Health_care["Worst"]))
+rules.append(ctrl.Rule(Diastolic_BP["High BP Stage 1"] & Systolic_BP["Pre Hypertension"] & Temperature["Low"] ,Health_care["Normal"]))
+rules.append(ctrl.Rule(Diastolic_BP["High BP Stage 1"] & Systolic_BP["Pre Hypertension"] & Temperature["Temp"] ,Health_care["Normal"]))
+rules.append(ctrl.Rule(Diastolic_BP["High BP Stage 1"] & Systolic_BP["Pre Hypertension"] & Temperature["Temp High 1"] ,Health_care["Normal"]))
+rules.append(ctrl.Rule(Diastolic_BP["High BP Stage 1"] & Systolic_BP["Pre Hypertension"] & Temperature["Temp High 2"] ,Health_care["Worst"]))
+rules.append(ctrl.Rule(Diastolic_BP["High BP Stage 1"] & Systolic_BP["Pre Hypertension"] & Temperature["Emergency"] ,Health_care["Worst"]))
+rules.append(ctrl.Rule(Diastolic_BP["High BP Stage 1"] & Systolic_BP["High BP Stage 1"] & Temperature["Low"] ,Health_care["Normal"]))
+rules.append(ctrl.Rule(Diastolic_BP["High BP Stage 1"] & Systolic_BP["High BP Stage 1"] & Temperature["Temp"] ,Health_care["Normal"]))
+rules.append(ctrl.Rule(Diastolic_BP["High BP Stage 1"] & Systolic_BP["High BP Stage 1"] & Temperature["Temp High 1"] ,Health_care["Normal"]))
+rules.append(ctrl.Rule(Diastolic_BP["High BP Stage 1"] & Systolic_BP["High BP Stage 1"] & Temperature["Temp High 2"] ,Health_care["Worst"]))
+rules.append(ctrl.Rule(Diastolic_BP["High BP Stage 1"] & Systolic_BP["High BP Stage 1"] & Temperature["Emergency"] ,Health_care["Worst"]))
+rules.append(ctrl.Rule(Diastolic_BP["High BP Stage 1"] & Systolic_BP["High BP Stage 2"] & Temperature["Low"] ,Health_care["Normal"]))
+rules.append(ctrl.Rule(Diastolic_BP["High BP Stage 1"] & Systolic_BP["High BP Stage 2"] & Temperature["Temp"] ,Health_care["Normal"]))
+rules.append(ctrl.Rule(Diastolic_BP["High BP Stage 1"] & Systolic_BP["High BP Stage 2"] & Temperature["Temp High 1"] ,Health_care["Normal"]))
+rules.append(ctrl.Rule(Diastolic_BP["High BP Stage 1"] & Systolic_BP["High BP Stage 2"] & Temperature["Temp High 2"] ,Health_care["Worst"]))
+rules.append(ctrl.Rule(Diastolic_BP["High BP Stage 1"] & Systolic_BP["High BP Stage 2"] & Temperature["Emergency"] ,Health_care["Worst"]))
+rules.append(ctrl.Rule(Diastolic_BP["High BP Stage 1"] & Systolic_BP["Emergency"] & Temperature["Low"] ,Health_care["Worst"]))
+rules.append(ctrl.Rule(Diastolic_BP["High BP Stage 1"] & Systolic_BP["Emergency"] & Temperature["Temp"] ,Health_care["Worst"]))
+rules.append(ctrl.Rule(Diastolic_BP["High BP Stage 1"] & Systolic_BP["Emergency"] & Temperature["Temp High 1"] ,Health_care["Worst"]))
+rules.append(ctrl.Rule(Diastolic_BP["High BP Stage 1"] & Systolic_BP["Emergency"] & Temperature["Temp High 2"] ,Health_care["Worst"]))
+rules.append(ctrl.Rule(Diastolic_BP["High BP Stage 1"] & Systolic_BP["Emergency"] & Temperature["Emergency"] ,Health_care["Dangerous"]))
+'''rules.append(ctrl.Rule(Diastolic_BP["High BP Stage 2"] & Systolic_BP["Low"] & Temperature["Low"] ,Health_care["Normal"]))
+rules.append(ctrl.Rule(Diastolic_BP["High BP Stage 2"] & Systolic_BP["Low"] & Temperature["Temp"] ,Health_care["Normal"]))
+rules.append(ctrl.Rule(Diastolic_BP["High BP Stage 2"] & Systolic_BP["Low"] & Temperature["Temp High 1"] ,Health_care["Normal"]))
+rules.append(ctrl.Rule(Diastolic_BP["High BP Stage 2"] & Systolic_BP["Low"] & Temperature["Temp High 2"] ,Health_care["Worst"]))
+rules.append(ctrl.Rule(Diastolic_BP["High BP Stage 2"] & Systolic_BP["Low"] & Temperature["Emergency"] ,Health_care["Worst"]))'''
+rules.append(ctrl.Rule(Diastolic_BP["High BP Stage 2"] & Systolic_BP["Normal"] & Temperature["Low"] ,Health_care["Normal"]))
+rules.append(ctrl.Rule(Diastolic_BP["High BP Stage 2"] & Systolic_BP["Normal"] & Temperature["Temp"] ,Health_care["Normal"]))
+rules.append(ctrl.Rule(Diastolic_BP["High BP Stage 2"] & Systolic_BP["Normal"] & Temperature["Temp High 1"] ,Health_care["Normal"]))
+rules.append(ctrl.Rule(Diastolic_BP["High BP Stage 2"] & Systolic_BP["Normal"] & Temperature["Temp High 2"] ,Health_care["Worst"]))
+rules.append(ctrl.Rule(Diastolic_BP["High BP Stage 2"] & Systolic_BP["Normal"] & Temperature["Emergency"] ,Health_care["Worst"]))
+rules.append(ctrl.Rule(Diastolic_BP["High BP Stage 2"] & Systolic_BP["Pre Hypertension"] & Temperature["Low"] ,Health_care["Normal"]))
+rules.append(ctrl.Rule(Diastolic_BP["High BP Stage 2"] & Systolic_BP["Pre Hypertension"] & Temperature["Temp"] ,Health_care["Normal"]))
+rules.append(ctrl.Rule(Diastolic_BP["High BP Stage 2"] & Systolic_BP["Pre Hypertension"] & Temperature["Temp High 1"] ,Health_care["Normal"]))
+rules.append(ctrl.Rule(Diastolic_BP["High BP Stage 2"] & Systolic_BP["Pre Hypertension"] & Temperature["Temp High 2"] ,Health_care["Worst"]))
+rules.append(ctrl.Rule(Diastolic_BP["High BP Stage 2"] & Systolic_BP["Pre Hypertension"] & Temperature["Emergency"] ,Health_care["Worst"]))
+'''rules.append(ctrl.Rule(Diastolic_BP["High BP Stage 2"] & Systolic_BP["High BP Stage 1"] & Temperature["Low"] ,Health_care["Worst"]))
+rules.append(ctrl.Rule(Diastolic_BP["High BP Stage 2"] & Systolic_BP["High BP Stage 1"] & Temperature["Temp"] ,Health_care["Worst"]))
+rules.append(ctrl.Rule(Diastolic_BP["High BP Stage 2"] & Systolic_BP["High BP Stage 1"] & Temperature["Temp High 1"] ,Health_care["Worst"]))'''
+rules.append(ctrl.Rule(Diastolic_BP["High BP Stage 2"] & Systolic_BP["High BP Stage 1"]  ,Health_care["Worst"]))
+rules.append(ctrl.Rule(Diastolic_BP["High BP Stage 2"] & Systolic_BP["High BP Stage 1"] & Temperature["Emergency"] ,Health_care["Dangerous"]))
+rules.append(ctrl.Rule(Diastolic_BP["High BP Stage 2"] & Systolic_BP["High BP Stage 2"] & Temperature["Low"] ,Health_care["Worst"]))
+rules.append(ctrl.Rule(Diastolic_BP["High BP Stage 2"] & Systolic_BP["High BP Stage 2"] & Temperature["Temp"] ,Health_care["Worst"]))
+rules.append(ctrl.Rule(Diastolic_BP["High BP Stage 2"] & Systolic_BP["High BP Stage 2"] & Temperature["Temp High 1"] ,Health_care["Dangerous"]))
+rules.append(ctrl.Rule(Diastolic_BP["High BP Stage 2"] & Systolic_BP["High BP Stage 2"] & Temperature["Temp High 2"] ,Health_care["Dangerous"]))
+rules.append(ctrl.Rule(Diastolic_BP["High BP Stage 2"] & Systolic_BP["High BP Stage 2"] & Temperature["Emergency"] ,Health_care["High Emergency"]))
+rules.append(ctrl.Rule(Diastolic_BP["High BP Stage 2"] & Systolic_BP["Emergency"] & Temperature["Low"] ,Health_care["Dangerous"]))
+rules.append(ctrl.Rule(Diastolic_BP["High BP Stage 2"] & Systolic_BP["Emergency"] & Temperature["Temp"] ,Health_care["Dangerous"]))
+rules.append(ctrl.Rule(Diastolic_BP["High BP Stage 2"] & Systolic_BP["Emergency"] & Temperature["Temp High 1"] ,Health_care["High Emergency"]))
+rules.append(ctrl.Rule(Diastolic_BP["High BP Stage 2"] & Systolic_BP["Emergency"] & Temperature["Temp High 2"] ,Health_care["High Emergency"]))
+rules.append(ctrl.Rule(Diastolic_BP["High BP Stage 2"] & Systolic_BP["Emergency"] & Temperature["Emergency"] ,Health_care["High Emergency"]))
+'''rules.append(ctrl.Rule(Diastolic_BP["Emergency"] & Systolic_BP["Low"] & Temperature["Low"] ,Health_care["Dangerous"]))
+rules.append(ctrl.Rule(Diastolic_BP["Emergency"] & Systolic_BP["Low"] & Temperature["Temp"] ,Health_care["Worst"]))
+rules.append(ctrl.Rule(Diastolic_BP["Emergency"] & Systolic_BP["Low"] & Temperature["Temp High 1"] ,Health_care["Dangerous"]))
+rules.append(ctrl.Rule(Diastolic_BP["Emergency"] & Systolic_BP["Low"] & Temperature["Temp High 2"] ,Health_care["Dangerous"]))
+rules.append(ctrl.Rule(Diastolic_BP["Emergency"] & Systolic_BP["Low"] & Temperature["Emergency"] ,Health_care["High Emergency"]))
+rules.append(ctrl.Rule(Diastolic_BP["Emergency"] & Systolic_BP["Normal"] & Temperature["Low"] ,Health_care["Worst"]))
+rules.append(ctrl.Rule(Diastolic_BP["Emergency"] & Systolic_BP["Normal"] & Temperature["Temp"] ,Health_care["Worst"]))
+rules.append(ctrl.Rule(Diastolic_BP["Emergency"] & Systolic_BP["Normal"] & Temperature["Temp High 1"] ,Health_care["Worst"]))
+rules.append(ctrl.Rule(Diastolic_BP["Emergency"] & Systolic_BP["Normal"] & Temperature["Temp High 2"] ,Health_care["Worst"]))
+rules.append(ctrl.Rule(Diastolic_BP["Emergency"] & Systolic_BP["Normal"] & Temperature["Emergency"] ,Health_care["Dangerous"]))'''
+rules.append(ctrl.Rule(Diastolic_BP["Emergency"] & Systolic_BP["Pre Hypertension"] & Temperature["Low"] ,Health_care["Worst"]))
+rules.append(ctrl.Rule(Diastolic_BP["Emergency"] & Systolic_BP["Pre Hypertension"] & Temperature["Temp"] ,Health_care["Worst"]))
+rules.append(ctrl.Rule(Diastolic_BP["Emergency"] & Systolic_BP["Pre Hypertension"] & Temperature["Temp High 1"] ,Health_care["Dangerous"]))
+rules.append(ctrl.Rule(Diastolic_BP["Emergency"] & Systolic_BP["Pre Hypertension"] & Temperature["Temp High 2"] ,Health_care["Dangerous"]))
+rules.append(ctrl.Rule(Diastolic_BP["Emergency"] & Systolic_BP["Pre Hypertension"] & Temperature["Emergency"] ,Health_care["High Emergency"]))
+rules.append(ctrl.Rule(Diastolic_BP["Emergency"] & Systolic_BP["High BP Stage 1"] ,Health_care["Dangerous"]))
+'''rules.append(ctrl.Rule(Diastolic_BP["Emergency"] & Systolic_BP["High BP Stage 1"] & Temperature["Temp"] ,Health_care["Dangerous"]))
+rules.append(ctrl.Rule(Diastolic_BP["Emergency"] & Systolic_BP["High BP Stage 1"] & Temperature["Temp High 1"] ,Health_care["Dangerous"]))
+rules.append(ctrl.Rule(Diastolic_BP["Emergency"] & Systolic_BP["High BP Stage 1"] & Temperature["Temp High 2"] ,Health_care["Dangerous"]))'''
+rules.append(ctrl.Rule(Diastolic_BP["Emergency"] & Systolic_BP["High BP Stage 1"] & Temperature["Emergency"] ,Health_care["High Emergency"]))
+rules.append(ctrl.Rule(Diastolic_BP["Emergency"] & Systolic_BP["High BP Stage 2"] & Temperature["Low"] ,Health_care["Dangerous"]))
+rules.append(ctrl.Rule(Diastolic_BP["Emergency"] & Systolic_BP["High BP Stage 2"] & Temperature["Temp"] ,Health_care["Dangerous"]))
+rules.append(ctrl.Rule(Diastolic_BP["Emergency"] & Systolic_BP["High BP Stage 2"] & Temperature["Temp High 1"] ,Health_care["High Emergency"]))
+rules.append(ctrl.Rule(Diastolic_BP["Emergency"] & Systolic_BP["High BP Stage 2"] & Temperature["Temp High 2"] ,Health_care["High Emergency"]))
+rules.append(ctrl.Rule(Diastolic_BP["Emergency"] & Systolic_BP["High BP Stage 2"] & Temperature["Emergency"] ,Health_care["High Emergency"]))
+rules.append(ctrl.Rule(Diastolic_BP["Emergency"] & Systolic_BP["Emergency"] ,Health_care["High Emergency"]))
+'''rules.append(ctrl.Rule(Diastolic_BP["Emergency"] & Systolic_BP["Emergency"] & Temperature["Temp"] ,Health_care["High Emergency"]))
+rules.append(ctrl.Rule(Diastolic_BP["Emergency"] & Systolic_BP["Emergency"] & Temperature["Temp High 1"] ,Health_care["High Emergency"]))
+rules.append(ctrl.Rule(Diastolic_BP["Emergency"] & Systolic_BP["Emergency"] & Temperature["Temp High 2"] ,Health_care["High Emergency"]))
+rules.append(ctrl.Rule(Diastolic_BP["Emergency"] & Systolic_BP["Emergency"] & Temperature["Emergency"] ,Health_care["High Emergency"]))'''
+
+
+# Compiled form of the rules for batch scoring and GA evaluation
+health_care_engine = BatchInference.from_rules(rules)
+
+
+def build_engine(input_step=1, output_step=1, continuous=False, **kwargs):
+    """
+    Returns a batch engine for ``rules`` at another universe resolution.
+
+    ``input_step`` and ``output_step`` are the sample spacing of the
+    antecedent and Health Care universes; the variables above use 1. With
+    ``continuous=True`` antecedent memberships are computed from the
+    triangle corners instead of interpolated from samples, so inputs are
+    not quantized at all. Universe bounds stay those of the variables
+    above. Rule weights are shared with ``health_care_engine``. Extra
+    keyword arguments go to ``BatchInference``.
+    """
+    tensor = health_care_engine.tensor
+    variables = [Diastolic_BP, Systolic_BP, Temperature]
+    terms = [diastolic_terms, systolic_terms, temperature_terms]
+    universes = []
+    term_mfs = []
+    for var, corners, labels in zip(variables, terms, tensor.term_labels):
+        lo, hi = var.universe.min(), var.universe.max()
+        universe = np.linspace(lo, hi, int(round((hi - lo) / input_step)) + 1)
+        universes.append(universe)
+        term_mfs.append([fuzz.trimf(universe, corners[label]) for label in labels])
+
+    lo, hi = Health_care.universe.min(), Health_care.universe.max()
+    output = ctrl.Consequent(np.linspace(lo, hi, int(round((hi - lo) / output_step)) + 1), label=Health_care.label)
+    output.automf(len(health_care_labels), names=health_care_labels)
+
+    term_params = None
+    if continuous:
+        term_params = [[corners[label] for label in labels] for corners, labels in zip(terms, tensor.term_labels)]
+    return BatchInference(tensor, universes, term_mfs, output.universe,
+                          [output.terms[label].mf for label in tensor.output_labels],
+                          term_params=term_params, **kwargs)
+
+
+def __getattr__(name):
+    # Create the control system lazily; the rules above are all the batch
+    # engine needs
+    if name == 'health_care_system':
+        global health_care_system
+        health_care_system = ctrl.ControlSystem(rules)
+        return health_care_system
+    raise AttributeError("module %r has no attribute %r" % (__name__, name))
+
+
+def measure_import_time():
+    """
+    Returns the seconds a fresh interpreter takes to import this module.
+    """
+    import os
+    import subprocess
+    import sys
+    import time
+
+    start = time.perf_counter()
+    subprocess.run([sys.executable, '-c', 'import health_care'], check=True,
+                   cwd=os.path.dirname(os.path.abspath(__file__)))
+    return time.perf_counter() - start
+
+
+if __name__ == '__main__':
+    import sys
+
+    if len(sys.argv) == 3 and sys.argv[1] == '--write-table':
+        # The rules as a table for RuleTensor.from_table, built from the
+        # ctrl.Rule list above so it can never drift from it
+        health_care_engine.tensor.to_table(sys.argv[2])
+        print("Wrote", sys.argv[2])
+        sys.exit(0)
+    elapsed = measure_import_time()
+    print("Cold import: %.2fs (budget %.2fs)" % (elapsed, IMPORT_BUDGET_SECONDS))
+    sys.exit(0 if elapsed <= IMPORT_BUDGET_SECONDS else 1)
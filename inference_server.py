@@ -0,0 +1,236 @@
+"""
+Local Health Care scoring server with request micro-batching.
+
+Incoming requests are queued and grouped into micro-batches that close when
+they reach ``max_batch_size`` or ``max_delay`` seconds after their first
+request, whichever comes first; each batch is scored with one vectorized
+engine call. Speaks a minimal HTTP/1.1 over TCP or a Unix socket:
+
+    POST /score    {"diastolic": 120, "systolic": 180, "temperature": 100}
+                   -> {"health_care": 74.3}
+                   (a JSON list of such objects gets a list back)
+    GET  /metrics  -> request counts, p50/p99 latency and batch sizes
+                      (plus engine stage timings and rule firing counts
+                      when started with --telemetry)
+    POST /metrics/reset -> clears the engine telemetry
+
+    python inference_server.py --port 8765
+    python inference_server.py --unix /tmp/health_care.sock --model health_care_model.npz
+"""
+import argparse
+import asyncio
+import json
+import time
+from collections import deque
+
+import numpy as np
+
+from dataset import INPUT_COLUMNS, TARGET_COLUMN
+
+
+class MicroBatcher:
+    """
+    Queues single-sample requests and scores them in batches.
+    """
+
+    def __init__(self, engine, max_batch_size=256, max_delay=0.002, history=10000):
+        self.engine = engine
+        self.max_batch_size = max_batch_size
+        self.max_delay = max_delay
+        self.queue = asyncio.Queue()
+        self.latencies = deque(maxlen=history)
+        self.batch_sizes = deque(maxlen=history)
+        self.requests = 0
+        self.batches = 0
+        self._task = None
+
+    def start(self):
+        self._task = asyncio.get_running_loop().create_task(self._run())
+
+    async def stop(self):
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+
+    async def score(self, values):
+        """
+        Returns the score for one tuple of inputs, once its batch has run.
+        """
+        future = asyncio.get_running_loop().create_future()
+        await self.queue.put((values, future, time.perf_counter()))
+        return await future
+
+    async def _run(self):
+        loop = asyncio.get_running_loop()
+        while True:
+            batch = [await self.queue.get()]
+            deadline = loop.time() + self.max_delay
+            while len(batch) < self.max_batch_size:
+                timeout = deadline - loop.time()
+                if timeout <= 0:
+                    break
+                try:
+                    batch.append(await asyncio.wait_for(self.queue.get(), timeout))
+                except asyncio.TimeoutError:
+                    break
+
+            inputs = np.array([values for values, _, _ in batch], dtype=np.float64).T
+            try:
+                # Score off the event loop so connections keep being served
+                scores = await loop.run_in_executor(None, self.engine.compute, *inputs)
+            except Exception as error:
+                for _, future, _ in batch:
+                    if not future.done():
+                        future.set_exception(error)
+                continue
+
+            done = time.perf_counter()
+            for (_, future, queued), score in zip(batch, scores):
+                if not future.done():
+                    future.set_result(None if np.isnan(score) else float(score))
+                self.latencies.append(done - queued)
+            self.batch_sizes.append(len(batch))
+            self.requests += len(batch)
+            self.batches += 1
+
+    def metrics(self):
+        """
+        Returns a JSON-friendly snapshot of counts, latency and batch sizes.
+        """
+        latencies = np.array(self.latencies) * 1000.0
+        sizes = np.array(self.batch_sizes)
+        return {
+            'requests': self.requests,
+            'batches': self.batches,
+            'latency_ms': {
+                'p50': float(np.percentile(latencies, 50)) if len(latencies) else None,
+                'p99': float(np.percentile(latencies, 99)) if len(latencies) else None,
+            },
+            'batch_size': {
+                'mean': float(sizes.mean()) if len(sizes) else None,
+                'p50': float(np.percentile(sizes, 50)) if len(sizes) else None,
+                'max': int(sizes.max()) if len(sizes) else None,
+            },
+        }
+
+
+def _parse_vitals(record):
+    # json accepts NaN and Infinity, which are not readings
+    values = tuple(float(record[name]) for name in INPUT_COLUMNS)
+    for name, value in zip(INPUT_COLUMNS, values):
+        if not np.isfinite(value):
+            raise ValueError("%s must be a finite number" % name)
+    return values
+
+
+async def _respond(writer, status, payload, keep_alive):
+    body = json.dumps(payload).encode()
+    reason = {200: 'OK', 400: 'Bad Request', 404: 'Not Found', 500: 'Internal Server Error'}[status]
+    writer.write(('HTTP/1.1 %d %s\r\nContent-Type: application/json\r\nContent-Length: %d\r\n'
+                  'Connection: %s\r\n\r\n' % (status, reason, len(body), 'keep-alive' if keep_alive else 'close')).encode()
+                 + body)
+    await writer.drain()
+
+
+async def handle_connection(batcher, reader, writer):
+    """
+    Serves HTTP requests on one connection until the client closes it.
+    """
+    try:
+        while True:
+            request_line = await reader.readline()
+            if not request_line:
+                break
+            method, path, _ = request_line.decode('latin-1').split(' ', 2)
+            headers = {}
+            while True:
+                line = await reader.readline()
+                if line in (b'\r\n', b'\n', b''):
+                    break
+                key, _, value = line.decode('latin-1').partition(':')
+                headers[key.strip().lower()] = value.strip()
+            body = await reader.readexactly(int(headers.get('content-length', 0)))
+            keep_alive = headers.get('connection', '').lower() != 'close'
+
+            if method == 'GET' and path == '/metrics':
+                metrics = batcher.metrics()
+                if batcher.engine.telemetry is not None:
+                    metrics['telemetry'] = batcher.engine.telemetry.snapshot()
+                await _respond(writer, 200, metrics, keep_alive)
+            elif method == 'POST' and path == '/metrics/reset':
+                if batcher.engine.telemetry is not None:
+                    batcher.engine.telemetry.reset()
+                await _respond(writer, 200, {}, keep_alive)
+            elif method == 'POST' and path == '/score':
+                try:
+                    payload = json.loads(body)
+                    records = payload if isinstance(payload, list) else [payload]
+                    vitals = [_parse_vitals(record) for record in records]
+                except (ValueError, KeyError, TypeError) as error:
+                    await _respond(writer, 400, {'error': str(error)}, keep_alive)
+                else:
+                    try:
+                        scores = await asyncio.gather(*[batcher.score(values) for values in vitals])
+                    except Exception as error:
+                        await _respond(writer, 500, {'error': str(error)}, keep_alive)
+                    else:
+                        results = [{TARGET_COLUMN: score} for score in scores]
+                        await _respond(writer, 200, results if isinstance(payload, list) else results[0], keep_alive)
+            else:
+                await _respond(writer, 404, {'error': 'not found'}, keep_alive)
+            if not keep_alive:
+                break
+    except (ConnectionError, asyncio.IncompleteReadError, ValueError):
+        pass
+    finally:
+        writer.close()
+
+
+async def serve(engine, host='127.0.0.1', port=8765, unix_path=None, max_batch_size=256, max_delay=0.002):
+    """
+    Runs the server until cancelled.
+    """
+    batcher = MicroBatcher(engine, max_batch_size=max_batch_size, max_delay=max_delay)
+    batcher.start()
+
+    def handler(reader, writer):
+        return handle_connection(batcher, reader, writer)
+
+    if unix_path is not None:
+        server = await asyncio.start_unix_server(handler, path=unix_path)
+    else:
+        server = await asyncio.start_server(handler, host, port)
+    try:
+        async with server:
+            await server.serve_forever()
+    finally:
+        await batcher.stop()
+
+
+def main(argv=None):
+    from score_stream import default_engine
+
+    parser = argparse.ArgumentParser(description="Serve Health Care scores over local HTTP.")
+    parser.add_argument('--host', default='127.0.0.1')
+    parser.add_argument('--port', type=int, default=8765)
+    parser.add_argument('--unix', help="listen on this Unix socket path instead of TCP")
+    parser.add_argument('--model', help="compiled model (.npz) to serve instead of health_care.py")
+    parser.add_argument('--max-batch-size', type=int, default=256)
+    parser.add_argument('--max-delay-ms', type=float, default=2.0, help="longest a request waits for its batch to fill")
+    parser.add_argument('--telemetry', action='store_true', help="record stage timings and rule firing in /metrics")
+    args = parser.parse_args(argv)
+
+    engine = default_engine(args.model)
+    if args.telemetry:
+        engine.enable_telemetry()
+    try:
+        asyncio.run(serve(engine, args.host, args.port, args.unix, args.max_batch_size, args.max_delay_ms / 1000.0))
+    except KeyboardInterrupt:
+        pass
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,106 @@
+"""
+Island-model GA: several populations evolving in separate processes.
+
+Each island runs ``migration_interval`` generations of the usual
+(mu + lambda) loop in its own process, then the islands swap their best
+``migration_size`` individuals, which replace the worst ones of the
+receiving island:
+
+* ``'ring'``: island i sends to island i + 1;
+* ``'random'``: each epoch the islands send around a ring in a random
+  order drawn from the seeded coordinator RNG.
+
+Islands are stepped in lock-step epochs and each carries its own
+``random`` state between them, so a fixed seed gives the same run
+whatever order the processes finish in.
+"""
+import multiprocessing
+import random
+
+from deap import tools
+
+from ga_loop import evolve, fitness_stats
+
+TOPOLOGIES = ('ring', 'random')
+
+_island_toolbox = None
+
+
+def _init_island(toolbox):
+    global _island_toolbox
+    _island_toolbox = toolbox
+
+
+def _run_epoch(args):
+    population, rndstate, generations, mu, lambda_, cxpb, mutpb = args
+    random.setstate(rndstate)
+    halloffame = tools.HallOfFame(1)
+    population, logbook = evolve(population, _island_toolbox, mu, lambda_, cxpb, mutpb, generations,
+                                 halloffame=halloffame, stats=fitness_stats(), verbose=False)
+    return population, random.getstate(), logbook, list(halloffame)
+
+
+def migration_order(topology, islands, rng):
+    """
+    Returns the ``migarray`` for ``tools.migRing``: entry i is the island
+    that island i sends its emigrants to.
+    """
+    if topology == 'ring':
+        return [(i + 1) % islands for i in range(islands)]
+    if topology == 'random':
+        # A ring through the islands in shuffled order, so no island sends
+        # to itself (a plain permutation often would)
+        ring = list(range(islands))
+        rng.shuffle(ring)
+        order = [None] * islands
+        for i, island in enumerate(ring):
+            order[island] = ring[(i + 1) % islands]
+        return order
+    raise ValueError("Unknown migration topology %r, expected one of %s" % (topology, ', '.join(TOPOLOGIES)))
+
+
+def run_islands(toolbox, islands, population_size, generations, cxpb, mutpb, migration_interval=5,
+                migration_size=1, topology='ring', seed=None, halloffame=None, verbose=True):
+    """
+    Evolves ``islands`` populations of ``population_size`` for
+    ``generations`` generations with ``toolbox``'s operators, one process
+    per island. Returns (populations, logbook); the logbook has one record
+    per island and epoch, tagged with ``island`` and the last generation
+    of the epoch.
+    """
+    rng = random.Random(seed)
+    populations = []
+    states = []
+    for _ in range(islands):
+        random.seed(rng.getrandbits(64))
+        populations.append(toolbox.population(n=population_size))
+        states.append(random.getstate())
+
+    logbook = tools.Logbook()
+    logbook.header = ['gen', 'island', 'nevals', 'seconds'] + fitness_stats().fields
+    pool = multiprocessing.Pool(islands, initializer=_init_island, initargs=(toolbox,))
+    try:
+        done = 0
+        while done < generations:
+            epoch = min(migration_interval, generations - done)
+            results = pool.map(_run_epoch, [(population, state, epoch, population_size, population_size, cxpb, mutpb)
+                                            for population, state in zip(populations, states)])
+            done += epoch
+            for island, (population, state, island_log, best) in enumerate(results):
+                populations[island] = population
+                states[island] = state
+                if halloffame is not None:
+                    halloffame.update(best)
+                last = island_log[-1]
+                logbook.record(gen=done, island=island, nevals=sum(island_log.select('nevals')),
+                               seconds=sum(island_log.select('seconds')),
+                               **{field: last[field] for field in fitness_stats().fields})
+                if verbose:
+                    print(logbook.stream)
+            if done < generations and islands > 1:
+                tools.migRing(populations, migration_size, tools.selBest, replacement=tools.selWorst,
+                              migarray=migration_order(topology, islands, rng))
+    finally:
+        pool.close()
+        pool.join()
+    return populations, logbook
@@ -1,236 +1,17 @@
 # This is a sample Python script.
 # This is a sample Python script.
 import numpy as np
-import skfuzzy as fuzz
-from skfuzzy import control as ctrl
-import matplotlib.pyplot as plt
-from tkinter import *
-from tkinter import ttk
-import tkinter as tk
-from PIL import Image, ImageTk
-from deap import base, creator, tools, algorithms
+from deap import base, creator, tools
 import random
+import multiprocessing
+from functools import lru_cache
+
+from health_care import Health_care, rules, health_care_engine
+from fuzzy_engine import FiringCache
+from dataset import VitalsDataset, mean_absolute_error
+from model_file import save_model
+from ga_loop import evolve, fitness_stats
 
-Diastolic_BP=ctrl.Antecedent(np.arange(40, 140, 1), label="Diastolic Blood Pressure")
-Systolic_BP=ctrl.Antecedent(np.arange(70, 200, 1), label="Systolic Blood Pressure")
-Temperature=ctrl.Antecedent(np.arange(98, 108, 1), label="Temperature")
-Health_care=ctrl.Consequent(np.arange(0,100,1),label="Health Care",defuzzify_method="centroid")
-
-
-Diastolic_BP['Low']=fuzz.trimf(Diastolic_BP.universe, [40, 55, 70])
-Diastolic_BP['Normal']=fuzz.trimf(Diastolic_BP.universe, [60, 72, 85])
-Diastolic_BP['Pre Hypertension']=fuzz.trimf(Diastolic_BP.universe, [80, 87, 95])
-Diastolic_BP['High BP Stage 1']=fuzz.trimf(Diastolic_BP.universe, [90, 97, 105])
-Diastolic_BP['High BP Stage 2']=fuzz.trimf(Diastolic_BP.universe, [100, 115, 125])
-Diastolic_BP['Emergency']=fuzz.trimf(Diastolic_BP.universe, [120, 130, 150])
-
-Systolic_BP['Low']=fuzz.trimf(Systolic_BP.universe, [70, 85, 100])
-Systolic_BP['Normal']=fuzz.trimf(Systolic_BP.universe, [90, 110, 130])
-Systolic_BP['Pre Hypertension']=fuzz.trimf(Systolic_BP.universe, [120, 135, 150])
-Systolic_BP['High BP Stage 1']=fuzz.trimf(Systolic_BP.universe, [140, 155, 170])
-Systolic_BP['High BP Stage 2']=fuzz.trimf(Systolic_BP.universe, [160, 175, 190])
-Systolic_BP['Emergency']=fuzz.trimf(Systolic_BP.universe, [180, 200, 220])
-
-Temperature['Low']=fuzz.trimf(Temperature.universe, [94, 96, 98])
-Temperature['Temp']=fuzz.trimf(Temperature.universe, [96, 98, 102])
-Temperature['Temp High 1']=fuzz.trimf(Temperature.universe, [98, 104, 106])
-Temperature['Temp High 2']=fuzz.trimf(Temperature.universe, [104, 106, 108])
-Temperature['Emergency']=fuzz.trimf(Temperature.universe, [106, 108, 110])
-
-Health_care.automf(5,names=['Good','Normal','Worst','Dangerous','High Emergency'])
-
-diastolic_labels = ['Low', 'Normal', 'Pre Hypertension', 'High BP Stage 1', 'High BP Stage 2', 'Emergency']
-systolic_labels = ['Low', 'Normal', 'Pre Hypertension', 'High BP Stage 1', 'High BP Stage 2', 'Emergency']
-temperature_labels = ['Low', 'Temp', 'Temp High 1', 'Temp High 2', 'Emergency']
-health_care_labels = ['Good', 'Normal', 'Worst','Dangerous','High Emergency']
-
-
-rules = []
-
-rules.append(ctrl.Rule(Diastolic_BP["Low"] & Systolic_BP["Low"] & Temperature["Low"] ,Health_care["Dangerous"]))
-rules.append(ctrl.Rule(Diastolic_BP["Low"] & Systolic_BP["Low"] & Temperature["Temp"] ,Health_care["Worst"]))
-rules.append(ctrl.Rule(Diastolic_BP["Low"] & Systolic_BP["Low"] & Temperature["Temp High 1"] ,Health_care["Worst"]))
-rules.append(ctrl.Rule(Diastolic_BP["Low"] & Systolic_BP["Low"] & Temperature["Temp High 2"] ,Health_care["Worst"]))
-rules.append(ctrl.Rule(Diastolic_BP["Low"] & Systolic_BP["Low"] & Temperature["Emergency"] ,Health_care["Worst"]))
-rules.append(ctrl.Rule(Diastolic_BP["Low"] & Systolic_BP["Normal"] & Temperature["Low"] ,Health_care["Normal"]))
-rules.append(ctrl.Rule(Diastolic_BP["Low"] & Systolic_BP["Normal"] & Temperature["Temp"] ,Health_care["Normal"]))
-rules.append(ctrl.Rule(Diastolic_BP["Low"] & Systolic_BP["Normal"] & Temperature["Temp High 1"] ,Health_care["Normal"]))
-rules.append(ctrl.Rule(Diastolic_BP["Low"] & Systolic_BP["Normal"] & Temperature["Temp High 2"] ,Health_care["Normal"]))
-rules.append(ctrl.Rule(Diastolic_BP["Low"] & Systolic_BP["Normal"] & Temperature["Emergency"] ,Health_care["Worst"]))
-rules.append(ctrl.Rule(Diastolic_BP["Low"] & Systolic_BP["Pre Hypertension"] & Temperature["Low"] ,Health_care["Normal"]))
-rules.append(ctrl.Rule(Diastolic_BP["Low"] & Systolic_BP["Pre Hypertension"] & Temperature["Temp"] ,Health_care["Normal"]))
-rules.append(ctrl.Rule(Diastolic_BP["Low"] & Systolic_BP["Pre Hypertension"] & Temperature["Temp High 1"] ,Health_care["Normal"]))
-rules.append(ctrl.Rule(Diastolic_BP["Low"] & Systolic_BP["Pre Hypertension"] & Temperature["Temp High 2"] ,Health_care["Normal"]))
-rules.append(ctrl.Rule(Diastolic_BP["Low"] & Systolic_BP["Pre Hypertension"] & Temperature["Emergency"] ,Health_care["Worst"]))
-rules.append(ctrl.Rule(Diastolic_BP["Low"] & Systolic_BP["High BP Stage 1"] & Temperature["Low"] ,Health_care["Normal"]))
-rules.append(ctrl.Rule(Diastolic_BP["Low"] & Systolic_BP["High BP Stage 1"] & Temperature["Temp"] ,Health_care["Normal"]))
-rules.append(ctrl.Rule(Diastolic_BP["Low"] & Systolic_BP["High BP Stage 1"] & Temperature["Temp High 1"] ,Health_care["Normal"]))
-rules.append(ctrl.Rule(Diastolic_BP["Low"] & Systolic_BP["High BP Stage 1"] & Temperature["Temp High 2"] ,Health_care["Normal"]))
-rules.append(ctrl.Rule(Diastolic_BP["Low"] & Systolic_BP["High BP Stage 1"] & Temperature["Emergency"] ,Health_care["Dangerous"]))
-rules.append(ctrl.Rule(Diastolic_BP["Low"] & Systolic_BP["High BP Stage 2"] & Temperature["Low"] ,Health_care["Worst"]))
-rules.append(ctrl.Rule(Diastolic_BP["Low"] & Systolic_BP["High BP Stage 2"] & Temperature["Temp"] ,Health_care["Worst"]))
-rules.append(ctrl.Rule(Diastolic_BP["Low"] & Systolic_BP["High BP Stage 2"] & Temperature["Temp High 1"] ,Health_care["Worst"]))
-rules.append(ctrl.Rule(Diastolic_BP["Low"] & Systolic_BP["High BP Stage 2"] & Temperature["Temp High 2"] ,Health_care["Worst"]))
-rules.append(ctrl.Rule(Diastolic_BP["Low"] & Systolic_BP["High BP Stage 2"] & Temperature["Emergency"] ,Health_care["Dangerous"]))
-rules.append(ctrl.Rule(Diastolic_BP["Low"] & Systolic_BP["Emergency"] & Temperature["Low"] ,Health_care["Worst"]))
-rules.append(ctrl.Rule(Diastolic_BP["Low"] & Systolic_BP["Emergency"] & Temperature["Temp"] ,Health_care["Worst"]))
-rules.append(ctrl.Rule(Diastolic_BP["Low"] & Systolic_BP["Emergency"] & Temperature["Temp High 1"] ,Health_care["Worst"]))
-rules.append(ctrl.Rule(Diastolic_BP["Low"] & Systolic_BP["Emergency"] & Temperature["Temp High 2"] ,Health_care["Dangerous"]))
-rules.append(ctrl.Rule(Diastolic_BP["Low"] & Systolic_BP["Emergency"] & Temperature["Emergency"] ,Health_care["High Emergency"]))
-rules.append(ctrl.Rule(Diastolic_BP["Normal"] & Systolic_BP["Low"] & Temperature["Low"] ,Health_care["Good"]))
-rules.append(ctrl.Rule(Diastolic_BP["Normal"] & Systolic_BP["Low"] & Temperature["Temp"] ,Health_care["Good"]))
-rules.append(ctrl.Rule(Diastolic_BP["Normal"] & Systolic_BP["Low"] & Temperature["Temp High 1"] ,Health_care["Normal"]))
-rules.append(ctrl.Rule(Diastolic_BP["Normal"] & Systolic_BP["Low"] & Temperature["Temp High 2"] ,Health_care["Normal"]))
-rules.append(ctrl.Rule(Diastolic_BP["Normal"] & Systolic_BP["Low"] & Temperature["Emergency"] ,Health_care["Worst"]))
-rules.append(ctrl.Rule(Diastolic_BP["Normal"] & Systolic_BP["Normal"] & Temperature["Low"] ,Health_care["Good"]))
-rules.append(ctrl.Rule(Diastolic_BP["Normal"] & Systolic_BP["Normal"] & Temperature["Temp"] ,Health_care["Good"]))
-rules.append(ctrl.Rule(Diastolic_BP["Normal"] & Systolic_BP["Normal"] & Temperature["Temp High 1"] ,Health_care["Normal"]))
-rules.append(ctrl.Rule(Diastolic_BP["Normal"] & Systolic_BP["Normal"] & Temperature["Temp High 2"] ,Health_care["Normal"]))
-rules.append(ctrl.Rule(Diastolic_BP["Normal"] & Systolic_BP["Normal"] & Temperature["Emergency"] ,Health_care["Worst"]))
-rules.append(ctrl.Rule(Diastolic_BP["Normal"] & Systolic_BP["Pre Hypertension"] & Temperature["Low"] ,Health_care["Normal"]))
-rules.append(ctrl.Rule(Diastolic_BP["Normal"] & Systolic_BP["Pre Hypertension"] & Temperature["Temp"] ,Health_care["Normal"]))
-rules.append(ctrl.Rule(Diastolic_BP["Normal"] & Systolic_BP["Pre Hypertension"] & Temperature["Temp High 1"] ,Health_care["Normal"]))
-rules.append(ctrl.Rule(Diastolic_BP["Normal"] & Systolic_BP["Pre Hypertension"] & Temperature["Temp High 2"] ,Health_care["Worst"]))
-rules.append(ctrl.Rule(Diastolic_BP["Normal"] & Systolic_BP["Pre Hypertension"] & Temperature["Emergency"] ,Health_care["Worst"]))
-rules.append(ctrl.Rule(Diastolic_BP["Normal"] & Systolic_BP["High BP Stage 1"] & Temperature["Low"] ,Health_care["Normal"]))
-rules.append(ctrl.Rule(Diastolic_BP["Normal"] & Systolic_BP["High BP Stage 1"] & Temperature["Temp"] ,Health_care["Normal"]))
-rules.append(ctrl.Rule(Diastolic_BP["Normal"] & Systolic_BP["High BP Stage 1"] & Temperature["Temp High 1"] ,Health_care["Normal"]))
-rules.append(ctrl.Rule(Diastolic_BP["Normal"] & Systolic_BP["High BP Stage 1"] & Temperature["Temp High 2"] ,Health_care["Worst"]))
-rules.append(ctrl.Rule(Diastolic_BP["Normal"] & Systolic_BP["High BP Stage 1"] & Temperature["Emergency"] ,Health_care["Dangerous"]))
-rules.append(ctrl.Rule(Diastolic_BP["Normal"] & Systolic_BP["High BP Stage 2"] & Temperature["Low"] ,Health_care["Worst"]))
-rules.append(ctrl.Rule(Diastolic_BP["Normal"] & Systolic_BP["High BP Stage 2"] & Temperature["Temp"] ,Health_care["Worst"]))
-rules.append(ctrl.Rule(Diastolic_BP["Normal"] & Systolic_BP["High BP Stage 2"] & Temperature["Temp High 1"] ,Health_care["Worst"]))
-rules.append(ctrl.Rule(Diastolic_BP["Normal"] & Systolic_BP["High BP Stage 2"] & Temperature["Temp High 2"] ,Health_care["Dangerous"]))
-rules.append(ctrl.Rule(Diastolic_BP["Normal"] & Systolic_BP["High BP Stage 2"] & Temperature["Emergency"] ,Health_care["Dangerous"]))
-rules.append(ctrl.Rule(Diastolic_BP["Normal"] & Systolic_BP["Emergency"] & Temperature["Low"] ,Health_care["Worst"]))
-rules.append(ctrl.Rule(Diastolic_BP["Normal"] & Systolic_BP["Emergency"] & Temperature["Temp"] ,Health_care["Worst"]))
-rules.append(ctrl.Rule(Diastolic_BP["Normal"] & Systolic_BP["Emergency"] & Temperature["Temp High 1"] ,Health_care["Dangerous"]))
-rules.append(ctrl.Rule(Diastolic_BP["Normal"] & Systolic_BP["Emergency"] & Temperature["Temp High 2"] ,Health_care["Dangerous"]))
-rules.append(ctrl.Rule(Diastolic_BP["Normal"] & Systolic_BP["Emergency"] & Temperature["Emergency"] ,Health_care["High Emergency"]))
-rules.append(ctrl.Rule(Diastolic_BP["Pre Hypertension"] & Systolic_BP["Low"] & Temperature["Low"] ,Health_care["Normal"]))
-rules.append(ctrl.Rule(Diastolic_BP["Pre Hypertension"] & Systolic_BP["Low"] & Temperature["Temp"] ,Health_care["Normal"]))
-rules.append(ctrl.Rule(Diastolic_BP["Pre Hypertension"] & Systolic_BP["Low"] & Temperature["Temp High 1"] ,Health_care["Normal"]))
-rules.append(ctrl.Rule(Diastolic_BP["Pre Hypertension"] & Systolic_BP["Low"] & Temperature["Temp High 2"] ,Health_care["Worst"]))
-rules.append(ctrl.Rule(Diastolic_BP["Pre Hypertension"] & Systolic_BP["Low"] & Temperature["Emergency"] ,Health_care["Dangerous"]))
-rules.append(ctrl.Rule(Diastolic_BP["Pre Hypertension"] & Systolic_BP["Normal"] & Temperature["Low"] ,Health_care["Normal"]))
-rules.append(ctrl.Rule(Diastolic_BP["Pre Hypertension"] & Systolic_BP["Normal"] & Temperature["Temp"] ,Health_care["Normal"]))
-rules.append(ctrl.Rule(Diastolic_BP["Pre Hypertension"] & Systolic_BP["Normal"] & Temperature["Temp High 1"] ,Health_care["Normal"]))
-rules.append(ctrl.Rule(Diastolic_BP["Pre Hypertension"] & Systolic_BP["Normal"] & Temperature["Temp High 2"] ,Health_care["Worst"]))
-rules.append(ctrl.Rule(Diastolic_BP["Pre Hypertension"] & Systolic_BP["Normal"] & Temperature["Emergency"] ,Health_care["Worst"]))
-rules.append(ctrl.Rule(Diastolic_BP["Pre Hypertension"] & Systolic_BP["Pre Hypertension"] & Temperature["Low"] ,Health_care["Normal"]))
-rules.append(ctrl.Rule(Diastolic_BP["Pre Hypertension"] & Systolic_BP["Pre Hypertension"] & Temperature["Temp"] ,Health_care["Normal"]))
-rules.append(ctrl.Rule(Diastolic_BP["Pre Hypertension"] & Systolic_BP["Pre Hypertension"] & Temperature["Temp High 1"] ,Health_care["Normal"]))
-rules.append(ctrl.Rule(Diastolic_BP["Pre Hypertension"] & Systolic_BP["Pre Hypertension"] & Temperature["Temp High 2"] ,Health_care["Worst"]))
-rules.append(ctrl.Rule(Diastolic_BP["Pre Hypertension"] & Systolic_BP["Pre Hypertension"] & Temperature["Emergency"] ,Health_care["Worst"]))
-rules.append(ctrl.Rule(Diastolic_BP["Pre Hypertension"] & Systolic_BP["High BP Stage 1"] & Temperature["Low"] ,Health_care["Worst"]))
-rules.append(ctrl.Rule(Diastolic_BP["Pre Hypertension"] & Systolic_BP["High BP Stage 1"] & Temperature["Temp"] ,Health_care["Worst"]))
-rules.append(ctrl.Rule(Diastolic_BP["Pre Hypertension"] & Systolic_BP["High BP Stage 1"] & Temperature["Temp High 1"] ,Health_care["Worst"]))
-rules.append(ctrl.Rule(Diastolic_BP["Pre Hypertension"] & Systolic_BP["High BP Stage 1"] & Temperature["Temp High 2"] ,Health_care["Worst"]))
-rules.append(ctrl.Rule(Diastolic_BP["Pre Hypertension"] & Systolic_BP["High BP Stage 1"] & Temperature["Emergency"] ,Health_care["Dangerous"]))
-rules.append(ctrl.Rule(Diastolic_BP["Pre Hypertension"] & Systolic_BP["High BP Stage 2"] & Temperature["Low"] ,Health_care["Worst"]))
-rules.append(ctrl.Rule(Diastolic_BP["Pre Hypertension"] & Systolic_BP["High BP Stage 2"] & Temperature["Temp"] ,Health_care["Worst"]))
-rules.append(ctrl.Rule(Diastolic_BP["Pre Hypertension"] & Systolic_BP["High BP Stage 2"] & Temperature["Temp High 1"] ,Health_care["Worst"]))
-rules.append(ctrl.Rule(Diastolic_BP["Pre Hypertension"] & Systolic_BP["High BP Stage 2"] & Temperature["Temp High 2"] ,Health_care["Dangerous"]))
-rules.append(ctrl.Rule(Diastolic_BP["Pre Hypertension"] & Systolic_BP["High BP Stage 2"] & Temperature["Emergency"] ,Health_care["Dangerous"]))
-'''rules.append(ctrl.Rule(Diastolic_BP["Pre Hypertension"] & Systolic_BP["Emergency"] & Temperature["Low"] ,Health_care["Dangerous"]))
-rules.append(ctrl.Rule(Diastolic_BP["Pre Hypertension"] & Systolic_BP["Emergency"] & Temperature["Temp"] ,Health_care["Dangerous"]))
-rules.append(ctrl.Rule(Diastolic_BP["Pre Hypertension"] & Systolic_BP["Emergency"] & Temperature["Temp High 1"] ,Health_care["Dangerous"]))'''
-rules.append(ctrl.Rule(Diastolic_BP["Pre Hypertension"] & Systolic_BP["Emergency"] ,Health_care["Dangerous"]))
-rules.append(ctrl.Rule(Diastolic_BP["Pre Hypertension"] & Systolic_BP["Emergency"] & Temperature["Emergency"] ,Health_care["High Emergency"]))
-rules.append(ctrl.Rule(Diastolic_BP["High BP Stage 1"] & Systolic_BP["Low"] & Temperature["Low"] ,Health_care["Normal"]))
-rules.append(ctrl.Rule(Diastolic_BP["High BP Stage 1"] & Systolic_BP["Low"] & Temperature["Temp"] ,Health_care["Normal"]))
-rules.append(ctrl.Rule(Diastolic_BP["High BP Stage 1"] & Systolic_BP["Low"] & Temperature["Temp High 1"] ,Health_care["Normal"]))
-rules.append(ctrl.Rule(Diastolic_BP["High BP Stage 1"] & Systolic_BP["Low"] & Temperature["Temp High 2"] ,Health_care["Worst"]))
-rules.append(ctrl.Rule(Diastolic_BP["High BP Stage 1"] & Systolic_BP["Low"] & Temperature["Emergency"] ,Health_care["Dangerous"]))
-rules.append(ctrl.Rule(Diastolic_BP["High BP Stage 1"] & Systolic_BP["Normal"] & Temperature["Low"] ,Health_care["Normal"]))
-rules.append(ctrl.Rule(Diastolic_BP["High BP Stage 1"] & Systolic_BP["Normal"] & Temperature["Temp"] ,Health_care["Normal"]))
-rules.append(ctrl.Rule(Diastolic_BP["High BP Stage 1"] & Systolic_BP["Normal"] & Temperature["Temp High 1"] ,Health_care["Normal"]))
-rules.append(ctrl.Rule(Diastolic_BP["High BP Stage 1"] & Systolic_BP["Normal"] & Temperature["Temp High 2"] ,Health_care["Worst"]))
-rules.append(ctrl.Rule(Diastolic_BP["High BP Stage 1"] & Systolic_BP["Normal"] & Temperature["Emergency"] ,Health_care["Worst"]))
-rules.append(ctrl.Rule(Diastolic_BP["High BP Stage 1"] & Systolic_BP["Pre Hypertension"] & Temperature["Low"] ,Health_care["Normal"]))
-rules.append(ctrl.Rule(Diastolic_BP["High BP Stage 1"] & Systolic_BP["Pre Hypertension"] & Temperature["Temp"] ,Health_care["Normal"]))
-rules.append(ctrl.Rule(Diastolic_BP["High BP Stage 1"] & Systolic_BP["Pre Hypertension"] & Temperature["Temp High 1"] ,Health_care["Normal"]))
-rules.append(ctrl.Rule(Diastolic_BP["High BP Stage 1"] & Systolic_BP["Pre Hypertension"] & Temperature["Temp High 2"] ,Health_care["Worst"]))
-rules.append(ctrl.Rule(Diastolic_BP["High BP Stage 1"] & Systolic_BP["Pre Hypertension"] & Temperature["Emergency"] ,Health_care["Worst"]))
-rules.append(ctrl.Rule(Diastolic_BP["High BP Stage 1"] & Systolic_BP["High BP Stage 1"] & Temperature["Low"] ,Health_care["Normal"]))
-rules.append(ctrl.Rule(Diastolic_BP["High BP Stage 1"] & Systolic_BP["High BP Stage 1"] & Temperature["Temp"] ,Health_care["Normal"]))
-rules.append(ctrl.Rule(Diastolic_BP["High BP Stage 1"] & Systolic_BP["High BP Stage 1"] & Temperature["Temp High 1"] ,Health_care["Normal"]))
-rules.append(ctrl.Rule(Diastolic_BP["High BP Stage 1"] & Systolic_BP["High BP Stage 1"] & Temperature["Temp High 2"] ,Health_care["Worst"]))
-rules.append(ctrl.Rule(Diastolic_BP["High BP Stage 1"] & Systolic_BP["High BP Stage 1"] & Temperature["Emergency"] ,Health_care["Worst"]))
-rules.append(ctrl.Rule(Diastolic_BP["High BP Stage 1"] & Systolic_BP["High BP Stage 2"] & Temperature["Low"] ,Health_care["Normal"]))
-rules.append(ctrl.Rule(Diastolic_BP["High BP Stage 1"] & Systolic_BP["High BP Stage 2"] & Temperature["Temp"] ,Health_care["Normal"]))
-rules.append(ctrl.Rule(Diastolic_BP["High BP Stage 1"] & Systolic_BP["High BP Stage 2"] & Temperature["Temp High 1"] ,Health_care["Normal"]))
-rules.append(ctrl.Rule(Diastolic_BP["High BP Stage 1"] & Systolic_BP["High BP Stage 2"] & Temperature["Temp High 2"] ,Health_care["Worst"]))
-rules.append(ctrl.Rule(Diastolic_BP["High BP Stage 1"] & Systolic_BP["High BP Stage 2"] & Temperature["Emergency"] ,Health_care["Worst"]))
-rules.append(ctrl.Rule(Diastolic_BP["High BP Stage 1"] & Systolic_BP["Emergency"] & Temperature["Low"] ,Health_care["Worst"]))
-rules.append(ctrl.Rule(Diastolic_BP["High BP Stage 1"] & Systolic_BP["Emergency"] & Temperature["Temp"] ,Health_care["Worst"]))
-rules.append(ctrl.Rule(Diastolic_BP["High BP Stage 1"] & Systolic_BP["Emergency"] & Temperature["Temp High 1"] ,Health_care["Worst"]))
-rules.append(ctrl.Rule(Diastolic_BP["High BP Stage 1"] & Systolic_BP["Emergency"] & Temperature["Temp High 2"] ,Health_care["Worst"]))
-rules.append(ctrl.Rule(Diastolic_BP["High BP Stage 1"] & Systolic_BP["Emergency"] & Temperature["Emergency"] ,Health_care["Dangerous"]))
-'''rules.append(ctrl.Rule(Diastolic_BP["High BP Stage 2"] & Systolic_BP["Low"] & Temperature["Low"] ,Health_care["Normal"]))
-rules.append(ctrl.Rule(Diastolic_BP["High BP Stage 2"] & Systolic_BP["Low"] & Temperature["Temp"] ,Health_care["Normal"]))
-rules.append(ctrl.Rule(Diastolic_BP["High BP Stage 2"] & Systolic_BP["Low"] & Temperature["Temp High 1"] ,Health_care["Normal"]))
-rules.append(ctrl.Rule(Diastolic_BP["High BP Stage 2"] & Systolic_BP["Low"] & Temperature["Temp High 2"] ,Health_care["Worst"]))
-rules.append(ctrl.Rule(Diastolic_BP["High BP Stage 2"] & Systolic_BP["Low"] & Temperature["Emergency"] ,Health_care["Worst"]))'''
-rules.append(ctrl.Rule(Diastolic_BP["High BP Stage 2"] & Systolic_BP["Normal"] & Temperature["Low"] ,Health_care["Normal"]))
-rules.append(ctrl.Rule(Diastolic_BP["High BP Stage 2"] & Systolic_BP["Normal"] & Temperature["Temp"] ,Health_care["Normal"]))
-rules.append(ctrl.Rule(Diastolic_BP["High BP Stage 2"] & Systolic_BP["Normal"] & Temperature["Temp High 1"] ,Health_care["Normal"]))
-rules.append(ctrl.Rule(Diastolic_BP["High BP Stage 2"] & Systolic_BP["Normal"] & Temperature["Temp High 2"] ,Health_care["Worst"]))
-rules.append(ctrl.Rule(Diastolic_BP["High BP Stage 2"] & Systolic_BP["Normal"] & Temperature["Emergency"] ,Health_care["Worst"]))
-rules.append(ctrl.Rule(Diastolic_BP["High BP Stage 2"] & Systolic_BP["Pre Hypertension"] & Temperature["Low"] ,Health_care["Normal"]))
-rules.append(ctrl.Rule(Diastolic_BP["High BP Stage 2"] & Systolic_BP["Pre Hypertension"] & Temperature["Temp"] ,Health_care["Normal"]))
-rules.append(ctrl.Rule(Diastolic_BP["High BP Stage 2"] & Systolic_BP["Pre Hypertension"] & Temperature["Temp High 1"] ,Health_care["Normal"]))
-rules.append(ctrl.Rule(Diastolic_BP["High BP Stage 2"] & Systolic_BP["Pre Hypertension"] & Temperature["Temp High 2"] ,Health_care["Worst"]))
-rules.append(ctrl.Rule(Diastolic_BP["High BP Stage 2"] & Systolic_BP["Pre Hypertension"] & Temperature["Emergency"] ,Health_care["Worst"]))
-'''rules.append(ctrl.Rule(Diastolic_BP["High BP Stage 2"] & Systolic_BP["High BP Stage 1"] & Temperature["Low"] ,Health_care["Worst"]))
-rules.append(ctrl.Rule(Diastolic_BP["High BP Stage 2"] & Systolic_BP["High BP Stage 1"] & Temperature["Temp"] ,Health_care["Worst"]))
-rules.append(ctrl.Rule(Diastolic_BP["High BP Stage 2"] & Systolic_BP["High BP Stage 1"] & Temperature["Temp High 1"] ,Health_care["Worst"]))'''
-rules.append(ctrl.Rule(Diastolic_BP["High BP Stage 2"] & Systolic_BP["High BP Stage 1"]  ,Health_care["Worst"]))
-rules.append(ctrl.Rule(Diastolic_BP["High BP Stage 2"] & Systolic_BP["High BP Stage 1"] & Temperature["Emergency"] ,Health_care["Dangerous"]))
-rules.append(ctrl.Rule(Diastolic_BP["High BP Stage 2"] & Systolic_BP["High BP Stage 2"] & Temperature["Low"] ,Health_care["Worst"]))
-rules.append(ctrl.Rule(Diastolic_BP["High BP Stage 2"] & Systolic_BP["High BP Stage 2"] & Temperature["Temp"] ,Health_care["Worst"]))
-rules.append(ctrl.Rule(Diastolic_BP["High BP Stage 2"] & Systolic_BP["High BP Stage 2"] & Temperature["Temp High 1"] ,Health_care["Dangerous"]))
-rules.append(ctrl.Rule(Diastolic_BP["High BP Stage 2"] & Systolic_BP["High BP Stage 2"] & Temperature["Temp High 2"] ,Health_care["Dangerous"]))
-rules.append(ctrl.Rule(Diastolic_BP["High BP Stage 2"] & Systolic_BP["High BP Stage 2"] & Temperature["Emergency"] ,Health_care["High Emergency"]))
-rules.append(ctrl.Rule(Diastolic_BP["High BP Stage 2"] & Systolic_BP["Emergency"] & Temperature["Low"] ,Health_care["Dangerous"]))
-rules.append(ctrl.Rule(Diastolic_BP["High BP Stage 2"] & Systolic_BP["Emergency"] & Temperature["Temp"] ,Health_care["Dangerous"]))
-rules.append(ctrl.Rule(Diastolic_BP["High BP Stage 2"] & Systolic_BP["Emergency"] & Temperature["Temp High 1"] ,Health_care["High Emergency"]))
-rules.append(ctrl.Rule(Diastolic_BP["High BP Stage 2"] & Systolic_BP["Emergency"] & Temperature["Temp High 2"] ,Health_care["High Emergency"]))
-rules.append(ctrl.Rule(Diastolic_BP["High BP Stage 2"] & Systolic_BP["Emergency"] & Temperature["Emergency"] ,Health_care["High Emergency"]))
-'''rules.append(ctrl.Rule(Diastolic_BP["Emergency"] & Systolic_BP["Low"] & Temperature["Low"] ,Health_care["Dangerous"]))
-rules.append(ctrl.Rule(Diastolic_BP["Emergency"] & Systolic_BP["Low"] & Temperature["Temp"] ,Health_care["Worst"]))
-rules.append(ctrl.Rule(Diastolic_BP["Emergency"] & Systolic_BP["Low"] & Temperature["Temp High 1"] ,Health_care["Dangerous"]))
-rules.append(ctrl.Rule(Diastolic_BP["Emergency"] & Systolic_BP["Low"] & Temperature["Temp High 2"] ,Health_care["Dangerous"]))
-rules.append(ctrl.Rule(Diastolic_BP["Emergency"] & Systolic_BP["Low"] & Temperature["Emergency"] ,Health_care["High Emergency"]))
-rules.append(ctrl.Rule(Diastolic_BP["Emergency"] & Systolic_BP["Normal"] & Temperature["Low"] ,Health_care["Worst"]))
-rules.append(ctrl.Rule(Diastolic_BP["Emergency"] & Systolic_BP["Normal"] & Temperature["Temp"] ,Health_care["Worst"]))
-rules.append(ctrl.Rule(Diastolic_BP["Emergency"] & Systolic_BP["Normal"] & Temperature["Temp High 1"] ,Health_care["Worst"]))
-rules.append(ctrl.Rule(Diastolic_BP["Emergency"] & Systolic_BP["Normal"] & Temperature["Temp High 2"] ,Health_care["Worst"]))
-rules.append(ctrl.Rule(Diastolic_BP["Emergency"] & Systolic_BP["Normal"] & Temperature["Emergency"] ,Health_care["Dangerous"]))'''
-rules.append(ctrl.Rule(Diastolic_BP["Emergency"] & Systolic_BP["Pre Hypertension"] & Temperature["Low"] ,Health_care["Worst"]))
-rules.append(ctrl.Rule(Diastolic_BP["Emergency"] & Systolic_BP["Pre Hypertension"] & Temperature["Temp"] ,Health_care["Worst"]))
-rules.append(ctrl.Rule(Diastolic_BP["Emergency"] & Systolic_BP["Pre Hypertension"] & Temperature["Temp High 1"] ,Health_care["Dangerous"]))
-rules.append(ctrl.Rule(Diastolic_BP["Emergency"] & Systolic_BP["Pre Hypertension"] & Temperature["Temp High 2"] ,Health_care["Dangerous"]))
-rules.append(ctrl.Rule(Diastolic_BP["Emergency"] & Systolic_BP["Pre Hypertension"] & Temperature["Emergency"] ,Health_care["High Emergency"]))
-rules.append(ctrl.Rule(Diastolic_BP["Emergency"] & Systolic_BP["High BP Stage 1"] ,Health_care["Dangerous"]))
-'''rules.append(ctrl.Rule(Diastolic_BP["Emergency"] & Systolic_BP["High BP Stage 1"] & Temperature["Temp"] ,Health_care["Dangerous"]))
-rules.append(ctrl.Rule(Diastolic_BP["Emergency"] & Systolic_BP["High BP Stage 1"] & Temperature["Temp High 1"] ,Health_care["Dangerous"]))
-rules.append(ctrl.Rule(Diastolic_BP["Emergency"] & Systolic_BP["High BP Stage 1"] & Temperature["Temp High 2"] ,Health_care["Dangerous"]))'''
-rules.append(ctrl.Rule(Diastolic_BP["Emergency"] & Systolic_BP["High BP Stage 1"] & Temperature["Emergency"] ,Health_care["High Emergency"]))
-rules.append(ctrl.Rule(Diastolic_BP["Emergency"] & Systolic_BP["High BP Stage 2"] & Temperature["Low"] ,Health_care["Dangerous"]))
-rules.append(ctrl.Rule(Diastolic_BP["Emergency"] & Systolic_BP["High BP Stage 2"] & Temperature["Temp"] ,Health_care["Dangerous"]))
-rules.append(ctrl.Rule(Diastolic_BP["Emergency"] & Systolic_BP["High BP Stage 2"] & Temperature["Temp High 1"] ,Health_care["High Emergency"]))
-rules.append(ctrl.Rule(Diastolic_BP["Emergency"] & Systolic_BP["High BP Stage 2"] & Temperature["Temp High 2"] ,Health_care["High Emergency"]))
-rules.append(ctrl.Rule(Diastolic_BP["Emergency"] & Systolic_BP["High BP Stage 2"] & Temperature["Emergency"] ,Health_care["High Emergency"]))
-rules.append(ctrl.Rule(Diastolic_BP["Emergency"] & Systolic_BP["Emergency"] ,Health_care["High Emergency"]))
-'''rules.append(ctrl.Rule(Diastolic_BP["Emergency"] & Systolic_BP["Emergency"] & Temperature["Temp"] ,Health_care["High Emergency"]))
-rules.append(ctrl.Rule(Diastolic_BP["Emergency"] & Systolic_BP["Emergency"] & Temperature["Temp High 1"] ,Health_care["High Emergency"]))
-rules.append(ctrl.Rule(Diastolic_BP["Emergency"] & Systolic_BP["Emergency"] & Temperature["Temp High 2"] ,Health_care["High Emergency"]))
-rules.append(ctrl.Rule(Diastolic_BP["Emergency"] & Systolic_BP["Emergency"] & Temperature["Emergency"] ,Health_care["High Emergency"]))'''
-
-
-# Create a control system
-health_care_system = ctrl.ControlSystem(rules)
 # GA begines from here
 creator.create("FitnessMax", base.Fitness, weights=(1.0,))
 creator.create("Individual", list, fitness=creator.FitnessMax)
@@ -243,32 +24,63 @@ toolbox.register("rule_strength", random.uniform, 0, 1)
 toolbox.register("individual", tools.initRepeat, creator.Individual, toolbox.rule_strength, n=len(rules))  # Adjust the number of rules
 toolbox.register("population", tools.initRepeat, list, toolbox.individual)
 
-# Define the evaluation function
-def evaluate(individual):
-    # Apply rule strengths to the fuzzy system
-    for i, rule_strength in enumerate(individual):
-       rules[i].weight = rule_strength
+# The GA inputs never change, so rule firing for them is computed once
+# (FiringCache) and each individual only re-weights it.
 
-    # Create a new control system
-    health_care_system = ctrl.ControlSystem(rules)
+# Labelled vitals to tune against (CSV or .npy, see dataset.py). With None the
+# GA falls back to scoring the single hardcoded case below.
+dataset_path = None
+dataset_sample_size = None  # rows drawn once from the dataset, None uses all of them
+dataset_seed = 0  # fixed so every pool worker draws the same rows
 
+if dataset_path is not None:
+    ga_dataset = VitalsDataset.load(dataset_path).sample(dataset_sample_size, seed=dataset_seed)
+    ga_firing = FiringCache(health_care_engine, *ga_dataset.inputs)
+else:
+    ga_dataset = None
     # Input values for the fuzzy system (adjust as needed)
-    health_care_simulation = ctrl.ControlSystemSimulation(health_care_system)
-    health_care_simulation.input['Diastolic Blood Pressure'] = 140
-    health_care_simulation.input['Systolic Blood Pressure'] = 200
-    health_care_simulation.input['Temperature'] = 108
+    ga_firing = FiringCache(health_care_engine, 140.0, 200.0, 108.0)
 
-    # Perform fuzzy inference
-    health_care_simulation.compute()
+# Error charged for a sample where no rule fires
+output_range = np.ptp(Health_care.universe)
 
-    # Get the output value
-    output_value = health_care_simulation.output['Health Care']
+@lru_cache(maxsize=4096)
+def weights_fitness(weights):
+    """
+    Returns the fitness tuple for a tuple of rule weights.
+
+    Memoized, since crossover and the mu+lambda carry-over keep producing
+    weight vectors that were already scored.
+    """
+    # Scale the precomputed rule activations by the weights
+    outputs = ga_firing.compute(np.array(weights))
+
+    if ga_dataset is not None:
+        # FitnessMax, so a lower error over the dataset is a higher fitness
+        return -mean_absolute_error(outputs, ga_dataset.targets, output_range),
+
+    output_value = outputs[0]
+    if np.isnan(output_value):
+        # Every firing rule was weighted down to zero
+        return 0.0,
 
     # Assuming a simple fitness function (adjust as needed)
     fitness = abs(50 - output_value)
 
     return fitness,
 
+# Define the evaluation function
+def evaluate(individual):
+    # mutGaussian can leave the [0, 1] range, which is not a valid
+    # membership degree
+    weights = np.clip(individual, 0, 1)
+
+    # Apply rule strengths to the fuzzy system
+    for i, rule_strength in enumerate(weights):
+       rules[i].weight = float(rule_strength)
+
+    return weights_fitness(tuple(weights.tolist()))
+
 toolbox.register("evaluate", evaluate)
 
 # Define the genetic operators
@@ -280,28 +92,107 @@ toolbox.register("select", tools.selTournament, tournsize=3)
 population_size = 10
 num_generations = 10
 mutation_rate = 0.1
-
-# Create the initial population
-population = toolbox.population(n=population_size)
-
-# Run the GA
-algorithms.eaMuPlusLambda(population, toolbox, mu=population_size, lambda_=population_size,
-                           cxpb=0.7, mutpb=mutation_rate, ngen=num_generations, stats=None, halloffame=None, verbose=True)
-
-# Get the best individual from the final population
-best_individual = tools.selBest(population, k=1)[0]
-
-# Print the best individual
-print("Best Individual:", best_individual)
-
-best_output = evaluate(best_individual)
-print("Best Health Care Output:", best_output)
-
-
-
+num_workers = 1  # processes used to evaluate the population, 1 runs serially
+random_seed = None  # set to an int for reproducible runs
+model_path = "health_care_model.npz"  # where the tuned model is saved, None to skip
+hall_of_fame_size = 5  # best individuals kept across all generations
+checkpoint_path = None  # e.g. "ga_checkpoint.pkl"; an existing file is resumed from
+checkpoint_every = 5  # generations between checkpoints
+early_stop_patience = None  # stop after this many generations without improvement, None to run them all
+early_stop_min_delta = 1e-6  # smallest best-fitness gain that counts as improvement
+num_islands = 1  # populations evolved in parallel processes (island model), 1 runs a single population
+migration_interval = 5  # generations between migrations
+migration_size = 1  # best individuals each island sends per migration
+migration_topology = "ring"  # "ring" or "random", see islands.py
+
+
+def run_ga(verbose=True):
+    """
+    Runs the GA and returns the final population, the hall of fame and the
+    logbook of per-generation timing and fitness stats.
+
+    With num_workers > 1 fitness is evaluated in a process pool. Each worker
+    has its own copy of the compiled engine and GA firing strengths (built
+    when it imports this module), so only individuals cross process
+    boundaries. Pool.map keeps results in population order, so a fixed
+    random_seed gives the same run whatever the worker count.
+
+    With checkpoint_path set the run is saved every checkpoint_every
+    generations, and rerunning after a pre-emption resumes from the file.
+
+    With num_islands > 1 each island is a population of population_size in
+    its own process (see islands.py); the returned population holds all of
+    them. Checkpointing and early stopping do not apply to island runs.
+    """
+    if num_islands > 1:
+        from islands import run_islands
+        halloffame = tools.HallOfFame(hall_of_fame_size)
+        populations, logbook = run_islands(toolbox, num_islands, population_size, num_generations,
+                                           cxpb=0.7, mutpb=mutation_rate, migration_interval=migration_interval,
+                                           migration_size=migration_size, topology=migration_topology,
+                                           seed=random_seed, halloffame=halloffame, verbose=verbose)
+        return [ind for population in populations for ind in population], halloffame, logbook
+
+    if random_seed is not None:
+        random.seed(random_seed)
+
+    # Create the initial population
+    population = toolbox.population(n=population_size)
+    halloffame = tools.HallOfFame(hall_of_fame_size)
+
+    pool = None
+    if num_workers > 1:
+        pool = multiprocessing.Pool(num_workers)
+        toolbox.register("map", pool.map)
+    try:
+        # Run the GA
+        population, logbook = evolve(population, toolbox, mu=population_size, lambda_=population_size,
+                                     cxpb=0.7, mutpb=mutation_rate, ngen=num_generations,
+                                     halloffame=halloffame, stats=fitness_stats(),
+                                     checkpoint_path=checkpoint_path, checkpoint_every=checkpoint_every,
+                                     patience=early_stop_patience, min_delta=early_stop_min_delta,
+                                     verbose=verbose)
+    finally:
+        if pool is not None:
+            toolbox.register("map", map)
+            pool.close()
+            pool.join()
+    return population, halloffame, logbook
+
+
+if __name__ == "__main__":
+    population, halloffame, logbook = run_ga()
+    if num_workers == 1 and num_islands == 1:
+        print("Fitness memo:", weights_fitness.cache_info())
+    print("GA time: %.2fs over %d generations" % (sum(logbook.select('seconds')), logbook[-1]['gen']))
+
+    # Best individual seen in any generation
+    best_individual = halloffame[0]
+
+    # Print the best individual
+    print("Best Individual:", best_individual)
+
+    # Workers only touched their own copies of rules, so apply the winner here
+    best_output = evaluate(best_individual)
+    print("Best Health Care Output:", best_output)
+
+    if model_path is not None:
+        health_care_engine.refresh_weights()
+        save_model(health_care_engine, model_path)
+        print("Saved tuned model to", model_path)
+
+
+
+
+
+'''from skfuzzy import control as ctrl
+from tkinter import *
+from tkinter import ttk
+import tkinter as tk
+from PIL import Image, ImageTk
 
 
-'''class FuzzyGui:
+class FuzzyGui:
     def __init__(self, master):
         self.master = master
         master.title("Fuzzy Health Care System")
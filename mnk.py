@@ -0,0 +1,254 @@
+"""
+m,n,k-game engine: Tic Tac Toe on an m x n board, k in a row to win.
+
+``MNKGame`` offers the list-of-lists API of tictactoe.py for any board
+size. ``best_move`` searches with depth-limited alpha-beta, deepening one
+ply at a time until the position is solved, ``max_depth`` is reached or
+the per-move ``time_budget`` runs out, and returns the move of the
+deepest completed iteration. Leaves at the depth limit are scored by a
+heuristic over every k-cell window; wins are detected incrementally from
+the lines through the last move.
+
+    game = MNKGame(4, 4, 3)
+    move, info = game.best_move(game.initial_state(), time_budget=1.0)
+"""
+import time
+
+X = "X"
+O = "O"
+EMPTY = None
+
+# Above any heuristic score, which is at most windows * 10 ** (k - 1)
+WIN = 10 ** 12
+DIRECTIONS = ((0, 1), (1, 0), (1, 1), (1, -1))
+
+
+class SearchTimeout(Exception):
+    pass
+
+
+class Position:
+    """
+    Flat, mutable board used by the search. Cells are indexed r * n + c.
+    """
+
+    def __init__(self, game, board):
+        self.game = game
+        self.cells = [cell for row in board for cell in row]
+        count_x = self.cells.count(X)
+        count_o = self.cells.count(O)
+        self.to_move = O if count_x > count_o else X
+        self.empty = len(self.cells) - count_x - count_o
+        self.won = game.winner(board)
+        self.history = []
+
+    def make(self, cell):
+        mark = self.to_move
+        self.history.append((cell, self.won))
+        self.cells[cell] = mark
+        self.empty -= 1
+        if self.won is None and self.game.wins_at(self.cells, cell):
+            self.won = mark
+        self.to_move = O if mark == X else X
+
+    def unmake(self):
+        cell, self.won = self.history.pop()
+        self.to_move = self.cells[cell]
+        self.cells[cell] = EMPTY
+        self.empty += 1
+
+
+class MNKGame:
+    """
+    Rules and search for one board size and line length.
+    """
+
+    def __init__(self, m=3, n=3, k=3):
+        if k > max(m, n):
+            raise ValueError("k=%d cannot fit on a %dx%d board" % (k, m, n))
+        self.m = m
+        self.n = n
+        self.k = k
+        # Every k-cell line segment, as flat cell indices
+        self.windows = []
+        for r in range(m):
+            for c in range(n):
+                for dr, dc in DIRECTIONS:
+                    end_r, end_c = r + dr * (k - 1), c + dc * (k - 1)
+                    if 0 <= end_r < m and 0 <= end_c < n:
+                        self.windows.append([(r + dr * step) * n + c + dc * step for step in range(k)])
+        # Cells closest to the center first, the usual strongest moves
+        center = ((m - 1) / 2, (n - 1) / 2)
+        self.cell_order = sorted(range(m * n), key=lambda cell: (abs(cell // n - center[0]) + abs(cell % n - center[1]), cell))
+
+    def initial_state(self):
+        """
+        Returns starting state of the board.
+        """
+        return [[EMPTY] * self.n for _ in range(self.m)]
+
+    def player(self, board):
+        """
+        Returns player who has the next turn on a board.
+        """
+        num_x = sum(row.count(X) for row in board)
+        num_o = sum(row.count(O) for row in board)
+        return O if num_x > num_o else X
+
+    def actions(self, board):
+        """
+        Returns all empty cells (i, j) of the board.
+        """
+        return [(i, j) for i in range(self.m) for j in range(self.n) if board[i][j] is EMPTY]
+
+    def result(self, board, action):
+        """
+        Returns the board that results from making move (i, j) on the board.
+        """
+        i, j = action
+        if board[i][j] is not EMPTY:
+            raise ValueError("Invalid action: cell already taken")
+        new_board = [row[:] for row in board]
+        new_board[i][j] = self.player(board)
+        return new_board
+
+    def winner(self, board):
+        """
+        Returns the winner of the game, if there is one.
+        """
+        cells = [cell for row in board for cell in row]
+        for window in self.windows:
+            mark = cells[window[0]]
+            if mark is not EMPTY and all(cells[cell] == mark for cell in window):
+                return mark
+        return None
+
+    def terminal(self, board):
+        """
+        Returns True if game is over, False otherwise.
+        """
+        return self.winner(board) is not None or all(cell is not EMPTY for row in board for cell in row)
+
+    def utility(self, board):
+        """
+        Returns 1 if X has won the game, -1 if O has won, 0 otherwise.
+        """
+        return {X: 1, O: -1}.get(self.winner(board), 0)
+
+    def wins_at(self, cells, cell):
+        """
+        Returns True if the mark on ``cell`` is part of k in a row, looking
+        only at the lines through that cell.
+        """
+        mark = cells[cell]
+        r, c = divmod(cell, self.n)
+        for dr, dc in DIRECTIONS:
+            count = 1
+            for sign in (1, -1):
+                i, j = r + sign * dr, c + sign * dc
+                while 0 <= i < self.m and 0 <= j < self.n and cells[i * self.n + j] == mark:
+                    count += 1
+                    i, j = i + sign * dr, j + sign * dc
+            if count >= self.k:
+                return True
+        return False
+
+    def evaluate(self, cells):
+        """
+        Returns a heuristic score from X's point of view: every window
+        still open to only one player counts 10 ** (its marks - 1) for them.
+        """
+        score = 0
+        for window in self.windows:
+            count_x = count_o = 0
+            for cell in window:
+                mark = cells[cell]
+                if mark == X:
+                    count_x += 1
+                elif mark == O:
+                    count_o += 1
+            if count_x and not count_o:
+                score += 10 ** (count_x - 1)
+            elif count_o and not count_x:
+                score -= 10 ** (count_o - 1)
+        return score
+
+    def _negamax(self, position, depth, alpha, beta, ply, search):
+        search['nodes'] += 1
+        if search['nodes'] & 1023 == 0 and time.perf_counter() > search['deadline']:
+            raise SearchTimeout()
+        if position.won is not None:
+            # The previous move won, the player to move has lost; sooner is worse
+            return -(WIN - ply)
+        if position.empty == 0:
+            return 0
+        if depth == 0:
+            search['cutoff'] = True
+            score = self.evaluate(position.cells)
+            return score if position.to_move == X else -score
+
+        best = -WIN - 1
+        for cell in self.cell_order:
+            if position.cells[cell] is not EMPTY:
+                continue
+            position.make(cell)
+            score = -self._negamax(position, depth - 1, -beta, -alpha, ply + 1, search)
+            position.unmake()
+            if score > best:
+                best = score
+                if best > alpha:
+                    alpha = best
+                    if alpha >= beta:
+                        break
+        return best
+
+    def best_move(self, board, time_budget=1.0, max_depth=None):
+        """
+        Returns ((i, j), info) for the player to move, or (None, info) if
+        the game is over. ``info`` has the depth of the last completed
+        iteration, its score for the player to move, the nodes searched,
+        the seconds used and whether the result is exact (solved without
+        hitting the depth limit, or a forced win or loss).
+
+        The first iteration always completes, so a move is returned even if
+        it takes longer than ``time_budget``. ``max_depth`` must be at least 1.
+        """
+        if max_depth is not None and max_depth < 1:
+            raise ValueError("max_depth must be at least 1, got %r" % (max_depth,))
+        start = time.perf_counter()
+        position = Position(self, board)
+        info = {'depth': 0, 'score': None, 'nodes': 0, 'seconds': 0.0, 'exact': False}
+        if position.won is not None or position.empty == 0:
+            return None, info
+
+        max_depth = position.empty if max_depth is None else min(max_depth, position.empty)
+        search = {'nodes': 0, 'deadline': float('inf')}
+        best_cell = None
+        root_order = [cell for cell in self.cell_order if position.cells[cell] is EMPTY]
+        for depth in range(1, max_depth + 1):
+            search['cutoff'] = False
+            try:
+                alpha, beta = -WIN - 1, WIN + 1
+                depth_best = None
+                for cell in root_order:
+                    position.make(cell)
+                    score = -self._negamax(position, depth - 1, -beta, -alpha, 1, search)
+                    position.unmake()
+                    if depth_best is None or score > alpha:
+                        alpha, depth_best = score, cell
+            except SearchTimeout:
+                break
+            finally:
+                # Only later iterations are timed, so there is always a move
+                search['deadline'] = start + time_budget
+            best_cell = depth_best
+            # A forced win or loss within the horizon is final too
+            info.update(depth=depth, score=alpha, exact=not search['cutoff'] or abs(alpha) >= WIN - depth)
+            # Search the previous best move first next time
+            root_order.remove(best_cell)
+            root_order.insert(0, best_cell)
+            if info['exact'] or time.perf_counter() > search['deadline']:
+                break
+
+        info.update(nodes=search['nodes'], seconds=time.perf_counter() - start)
+        return divmod(best_cell, self.n), info
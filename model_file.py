@@ -0,0 +1,109 @@
+"""
+Save and load a compiled fuzzy model as a single versioned ``.npz`` file.
+
+The file holds everything ``BatchInference`` needs: universes and term
+membership arrays of every variable, the rule tensor and its weights. A
+serving process can start from it without skfuzzy or the rule definitions.
+Members are stored uncompressed, so ``load_model`` memory-maps them
+straight out of the archive instead of reading copies.
+"""
+import zipfile
+
+import numpy as np
+
+from fuzzy_engine import BatchInference
+from rule_tensor import RuleTensor
+
+MODEL_FORMAT_VERSION = 1
+
+
+def save_model(engine, path):
+    """
+    Writes a ``BatchInference`` engine to ``path`` (an ``.npz`` file).
+    """
+    tensor = engine.tensor
+    arrays = {
+        'format_version': np.array(MODEL_FORMAT_VERSION),
+        'variables': np.array(tensor.variables),
+        'output_label': np.array(tensor.output_label),
+        'output_labels': np.array(tensor.output_labels),
+        'output_universe': engine.consequent_universe,
+        'output_mfs': np.array(engine.consequent_mfs),
+        'rule_index': tensor.index,
+        'rule_consequent': tensor.consequent,
+        'rule_weights': tensor.weights,
+        'upsample': np.array(engine.upsample),
+        'defuzzify_method': np.array(engine.defuzzify_method),
+    }
+    for v, labels in enumerate(tensor.term_labels):
+        arrays['labels_%d' % v] = np.array(labels)
+        arrays['universe_%d' % v] = engine.universes[v]
+        arrays['mfs_%d' % v] = np.array(engine.term_mfs[v])
+        if engine.term_params is not None:
+            arrays['params_%d' % v] = np.array(engine.term_params[v])
+    np.savez(path, **arrays)
+
+
+def _mmap_npz(path):
+    """
+    Returns {name: array} for an uncompressed ``.npz``, with every numeric
+    member memory-mapped read-only from its offset inside the archive.
+    """
+    arrays = {}
+    with zipfile.ZipFile(path) as archive, open(path, 'rb') as f:
+        for info in archive.infolist():
+            name = info.filename[:-len('.npy')]
+            if info.compress_type != zipfile.ZIP_STORED:
+                arrays[name] = np.load(archive.open(info))
+                continue
+            # Skip the zip local file header to reach the .npy data
+            f.seek(info.header_offset + 26)
+            name_length, extra_length = np.frombuffer(f.read(4), dtype='<u2')
+            f.seek(info.header_offset + 30 + int(name_length) + int(extra_length))
+            version = np.lib.format.read_magic(f)
+            if version == (1, 0):
+                shape, fortran_order, dtype = np.lib.format.read_array_header_1_0(f)
+            else:
+                shape, fortran_order, dtype = np.lib.format.read_array_header_2_0(f)
+            if dtype.kind in 'US' or 0 in shape:
+                f.seek(info.header_offset + 30 + int(name_length) + int(extra_length))
+                arrays[name] = np.lib.format.read_array(f)
+            else:
+                arrays[name] = np.memmap(f, dtype=dtype, mode='r', shape=shape, offset=f.tell(),
+                                         order='F' if fortran_order else 'C')
+    return arrays
+
+
+def load_model(path, mmap=True, **kwargs):
+    """
+    Returns the ``BatchInference`` engine stored in ``path``.
+
+    Extra keyword arguments (e.g. ``chunk_size``, or ``defuzzify_method``
+    to override the saved one) go to ``BatchInference``.
+    Rule weights are copied so they can be changed in place; with
+    ``mmap=False`` every array is read into memory.
+    """
+    if mmap:
+        arrays = _mmap_npz(path)
+    else:
+        with np.load(path) as data:
+            arrays = dict(data)
+    version = int(arrays['format_version'])
+    if version != MODEL_FORMAT_VERSION:
+        raise ValueError("%s has model format %d, expected %d" % (path, version, MODEL_FORMAT_VERSION))
+
+    variables = [str(v) for v in arrays['variables']]
+    term_labels = [[str(label) for label in arrays['labels_%d' % v]] for v in range(len(variables))]
+    output_labels = [str(label) for label in arrays['output_labels']]
+    tensor = RuleTensor(variables, term_labels, str(arrays['output_label']), output_labels,
+                        arrays['rule_index'], arrays['rule_consequent'], np.array(arrays['rule_weights']))
+    kwargs.setdefault('upsample', int(arrays['upsample']))
+    if 'params_0' in arrays:
+        kwargs.setdefault('term_params', [arrays['params_%d' % v] for v in range(len(variables))])
+    kwargs.setdefault('defuzzify_method', str(arrays.get('defuzzify_method', 'centroid')))
+    return BatchInference(tensor,
+                          [arrays['universe_%d' % v] for v in range(len(variables))],
+                          [list(arrays['mfs_%d' % v]) for v in range(len(variables))],
+                          arrays['output_universe'],
+                          list(arrays['output_mfs']),
+                          **kwargs)
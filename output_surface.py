@@ -0,0 +1,150 @@
+"""
+Precomputed output surface for table-lookup scoring.
+
+The crisp output is evaluated once on every point of the antecedent
+universes (100 x 130 x 10 for the health-care system), saved as an
+``.npy`` file and memory-mapped; queries are answered by trilinear
+interpolation between the surrounding grid points. Between grid points
+this is an approximation of the full inference, exact on the grid itself.
+"""
+import glob
+import hashlib
+import os
+
+import numpy as np
+
+
+class OutputSurface:
+    """
+    Lookup table over the antecedent universes of a ``BatchInference``.
+
+    The file name carries a fingerprint of the rule tensor, rule weights,
+    membership functions and defuzzification settings (method, upsampling
+    and continuous term corners), so any change to the weights makes
+    ``compute`` build (or load) a matching surface instead of reusing a
+    stale one. Everything but the weights is hashed once, when the
+    surface is created. At most ``max_files`` surfaces are kept
+    in ``cache_dir``; the least recently used ones are deleted.
+
+    Re-reading ``rule.weight`` from every rule costs about as much as the
+    lookup itself; pass ``track_rules=False`` when weights only change
+    through ``engine.tensor.weights`` (or not at all).
+    """
+
+    def __init__(self, engine, cache_dir='.surface_cache', max_files=4, track_rules=True):
+        self.engine = engine
+        self.cache_dir = cache_dir
+        self.max_files = max_files
+        self.track_rules = track_rules
+        self.axes = [universe.astype(np.float64) for universe in engine.universes]
+        self.key = None
+        self.grid = None
+
+        h = hashlib.sha1()
+        for array in ([engine.tensor.index, engine.tensor.consequent, engine.output_universe, engine.output_mfs]
+                      + self.axes + [mf for mfs in engine.term_mfs for mf in mfs]):
+            h.update(np.ascontiguousarray(array).tobytes())
+        h.update(repr((engine.defuzzify_method, engine.upsample, engine.term_params)).encode())
+        self._static_digest = h.digest()
+        self._fingerprint = None
+        self._fingerprint_weights = None
+
+        # Flat grid offset of each of the 2 ** d corners of a cell
+        strides = np.cumprod([1] + [len(axis) for axis in self.axes[:0:-1]])[::-1]
+        self._strides = strides
+        self._corners = [[(corner >> v) & 1 for v in range(len(self.axes))]
+                         for corner in range(1 << len(self.axes))]
+        self._corner_offsets = [int(np.dot(bits, strides)) for bits in self._corners]
+
+    def fingerprint(self):
+        """
+        Returns a hex digest of everything the surface depends on, rehashing
+        only when the rule weights have changed.
+        """
+        weights = self.engine.tensor.weights
+        if self._fingerprint is None or not np.array_equal(self._fingerprint_weights, weights):
+            h = hashlib.sha1(self._static_digest)
+            h.update(np.ascontiguousarray(weights).tobytes())
+            self._fingerprint = h.hexdigest()[:16]
+            self._fingerprint_weights = weights.copy()
+        return self._fingerprint
+
+    @property
+    def path(self):
+        return os.path.join(self.cache_dir, 'surface_%s.npy' % self.key)
+
+    def build(self):
+        """
+        Evaluates the engine over the full grid and writes it to ``path``.
+        """
+        points = np.meshgrid(*self.axes, indexing='ij')
+        grid = self.engine.compute(*points)
+        os.makedirs(self.cache_dir, exist_ok=True)
+        tmp = self.path + '.tmp.npy'
+        np.save(tmp, grid)
+        os.replace(tmp, self.path)
+
+    def prune(self):
+        """
+        Deletes all but the ``max_files`` most recently used surfaces.
+        """
+        files = sorted(glob.glob(os.path.join(self.cache_dir, 'surface_*.npy')), key=os.path.getmtime, reverse=True)
+        for path in files[self.max_files:]:
+            if path != self.path:
+                os.remove(path)
+
+    def ensure_current(self):
+        """
+        Maps the surface matching the current rules and weights, building
+        it first if no such file exists yet.
+        """
+        if self.track_rules and self.engine.rules is not None:
+            self.engine.refresh_weights()
+        key = self.fingerprint()
+        if key != self.key or self.grid is None:
+            self.key = key
+            if os.path.exists(self.path):
+                # Mark it recently used, for prune
+                os.utime(self.path)
+            else:
+                self.build()
+            self.prune()
+            # A plain ndarray view indexes faster than np.memmap
+            self.grid = np.load(self.path, mmap_mode='r').view(np.ndarray)
+        return self.grid
+
+    def compute(self, *inputs):
+        """
+        Returns the interpolated output for arrays of inputs, one per
+        antecedent, clipped to the universes like the engine does.
+
+        Queries next to grid points where no rule fires are scored by the
+        engine itself, so they only come back NaN where it does.
+        """
+        grid = self.ensure_current().reshape(-1)
+        inputs = np.broadcast_arrays(*[np.asarray(x, dtype=np.float64) for x in inputs])
+        shape = inputs[0].shape
+        base = 0
+        frac = []
+        clipped = []
+        for axis, values, stride in zip(self.axes, inputs, self._strides):
+            values = np.clip(values.ravel(), axis[0], axis[-1])
+            i = np.clip(np.searchsorted(axis, values, side='right') - 1, 0, len(axis) - 2)
+            base = base + i * stride
+            frac.append((values - axis[i]) / (axis[i + 1] - axis[i]))
+            clipped.append(values)
+
+        out = np.zeros(len(clipped[0]))
+        for bits, offset in zip(self._corners, self._corner_offsets):
+            weight = 1.0
+            for upper, f in zip(bits, frac):
+                weight = weight * (f if upper else 1.0 - f)
+            # Skip zero-weight corners so NaN cells do not leak into
+            # queries that sit exactly on a neighbouring grid point.
+            values = grid[base + offset]
+            out += np.where(weight > 0, weight * values, 0.0)
+
+        missing = np.isnan(out)
+        if missing.any():
+            out[missing] = self.engine.compute(*[values[missing] for values in clipped])
+        return out.reshape(shape)
@@ -0,0 +1,123 @@
+"""
+Precomputed perfect-play table for Tic Tac Toe.
+
+Every position reachable from the empty board is solved once and the
+value and move ``tictactoe.minimax`` would give it are written to a binary
+file with one byte per board, at the board's base-3 index (cell (i, j)
+is digit 3 * i + j, EMPTY/X/O are 0/1/2). The file is memory-mapped, so
+a lookup reads a single byte.
+
+    python perfect_play.py            # writes tictactoe_table.bin
+
+The header carries a hash of tictactoe.py; if the game code changes the
+table counts as stale and ``tictactoe.minimax`` searches instead.
+"""
+import hashlib
+import mmap
+import os
+
+import tictactoe as ttt
+
+MAGIC = b'TTTPLAY1'
+SIZE = 3 ** 9
+DEFAULT_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'tictactoe_table.bin')
+
+# Entry byte: low 4 bits the move cell (NO_MOVE if none), next 2 bits the value
+NO_MOVE = 0xF
+UNSOLVED = 0xFF
+VALUES = [None, float('-inf'), 0, float('inf')]
+
+
+def fingerprint():
+    """
+    Returns a digest of tictactoe.py, which defines the values stored.
+    """
+    with open(ttt.__file__, 'rb') as f:
+        return hashlib.sha1(f.read()).digest()
+
+
+def board_index(board):
+    index = 0
+    for k, cell in enumerate(cell for row in board for cell in row):
+        index += (0 if cell is ttt.EMPTY else 1 if cell == ttt.X else 2) * 3 ** k
+    return index
+
+
+def _encode(value, move):
+    cell = NO_MOVE if move is None else 3 * move[0] + move[1]
+    return VALUES.index(value) << 4 | cell
+
+
+def solve():
+    """
+    Returns the table bytes for every board reachable from the empty one.
+    """
+    table = bytearray([UNSOLVED]) * SIZE
+    pending = [ttt.initial_state()]
+    while pending:
+        board = pending.pop()
+        index = board_index(board)
+        if table[index] != UNSOLVED:
+            continue
+        value, _ = ttt.minimax_value(board)
+        table[index] = _encode(value, ttt.minimax(board, 'table'))
+        if not ttt.terminal(board):
+            pending.extend(ttt.result(board, action) for action in ttt.actions(board))
+    return bytes(table)
+
+
+def write_table(path=DEFAULT_PATH):
+    tmp = path + '.tmp'
+    with open(tmp, 'wb') as f:
+        f.write(MAGIC + fingerprint() + solve())
+    os.replace(tmp, path)
+
+
+class PlayTable:
+    """
+    Memory-mapped perfect-play table.
+    """
+
+    def __init__(self, path=DEFAULT_PATH):
+        with open(path, 'rb') as f:
+            self.data = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        header = len(MAGIC) + len(fingerprint())
+        if self.data[:len(MAGIC)] != MAGIC or len(self.data) != header + SIZE:
+            raise ValueError("%s is not a Tic Tac Toe play table" % path)
+        self.offset = header
+        self.stale = self.data[len(MAGIC):header] != fingerprint()
+
+    def lookup(self, board):
+        """
+        Returns (value, move) for a board, like tictactoe.minimax_value
+        gives the value and tictactoe.minimax the move. Raises KeyError
+        for boards that cannot be reached in a game.
+        """
+        entry = self.data[self.offset + board_index(board)]
+        if entry == UNSOLVED:
+            raise KeyError("Board is not reachable from the initial state")
+        cell = entry & 0xF
+        return VALUES[entry >> 4], None if cell == NO_MOVE else divmod(cell, 3)
+
+
+_default_table = None
+
+
+def default_table():
+    """
+    Returns the PlayTable at DEFAULT_PATH, or None if it is missing, stale
+    or unreadable. Opened once per process.
+    """
+    global _default_table
+    if _default_table is None:
+        try:
+            table = PlayTable(DEFAULT_PATH)
+            _default_table = False if table.stale else table
+        except (OSError, ValueError):
+            _default_table = False
+    return _default_table or None
+
+
+if __name__ == '__main__':
+    write_table()
+    print("Wrote", DEFAULT_PATH)
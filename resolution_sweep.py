@@ -0,0 +1,116 @@
+"""
+Sweep universe resolutions and report throughput against accuracy.
+
+Every setting is scored on the same random vitals and compared with a
+reference that has no resolution limit at all: continuous antecedent
+memberships and the closed-form centroid, i.e. the limit both universes
+converge to as their step goes to zero.
+
+    python resolution_sweep.py --samples 20000 --max-deviation 0.5
+"""
+import argparse
+import json
+import time
+
+import numpy as np
+
+import health_care
+
+# (input_step, output_step, continuous, defuzzify_method, upsample)
+DEFAULT_SETTINGS = [
+    (1, 1, False, 'centroid', 20),  # current model
+    (1, 1, False, 'centroid', 5),
+    (1, 1, False, 'centroid', 1),
+    (0.5, 1, False, 'centroid', 20),
+    (0.25, 1, False, 'centroid', 20),
+    (1, 1, True, 'centroid', 20),
+    (1, 0.5, True, 'centroid', 10),
+    (1, 1, True, 'centroid', 5),
+    (1, 1, False, 'analytic', 1),
+    (0.5, 1, False, 'analytic', 1),
+    (1, 1, True, 'analytic', 1),
+    (1, 1, True, 'weighted_average', 1),
+]
+
+
+def random_vitals(samples, seed=0):
+    """
+    Returns uniformly drawn (diastolic, systolic, temperature) arrays
+    covering the model's universes.
+    """
+    rng = np.random.default_rng(seed)
+    return tuple(rng.uniform(var.universe.min(), var.universe.max(), samples)
+                 for var in (health_care.Diastolic_BP, health_care.Systolic_BP, health_care.Temperature))
+
+
+def sweep(settings=DEFAULT_SETTINGS, samples=20000, seed=0, repeats=3):
+    """
+    Returns one result dict per setting, with throughput in samples per
+    second (best of ``repeats``) and max/mean absolute deviation from the
+    reference. Samples where either side fires no rule are skipped.
+    """
+    inputs = random_vitals(samples, seed)
+    reference = health_care.build_engine(continuous=True, defuzzify_method='analytic').compute(*inputs)
+    results = []
+    for input_step, output_step, continuous, method, upsample in settings:
+        engine = health_care.build_engine(input_step, output_step, continuous,
+                                          defuzzify_method=method, upsample=upsample)
+        best = np.inf
+        for _ in range(repeats):
+            start = time.perf_counter()
+            outputs = engine.compute(*inputs)
+            best = min(best, time.perf_counter() - start)
+        deviation = np.abs(outputs - reference)
+        deviation = deviation[~np.isnan(deviation)]
+        results.append({
+            'input_step': input_step,
+            'output_step': output_step,
+            'continuous': continuous,
+            'defuzzify_method': method,
+            'upsample': upsample,
+            'samples_per_second': samples / best,
+            'max_deviation': float(deviation.max()),
+            'mean_deviation': float(deviation.mean()),
+        })
+    return results
+
+
+def cheapest(results, max_deviation):
+    """
+    Returns the fastest result whose max deviation is within the bound, or None.
+    """
+    fitting = [r for r in results if r['max_deviation'] <= max_deviation]
+    return max(fitting, key=lambda r: r['samples_per_second']) if fitting else None
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Report Health Care throughput against accuracy per universe resolution.")
+    parser.add_argument('--samples', type=int, default=20000)
+    parser.add_argument('--seed', type=int, default=0)
+    parser.add_argument('--max-deviation', type=float, help="pick the fastest setting within this bound")
+    parser.add_argument('--json', action='store_true', help="print results as JSON")
+    args = parser.parse_args(argv)
+
+    results = sweep(samples=args.samples, seed=args.seed)
+    choice = cheapest(results, args.max_deviation) if args.max_deviation is not None else None
+    if args.json:
+        print(json.dumps({'results': results, 'cheapest': choice}, indent=2))
+        return
+
+    print("%6s %6s %10s %16s %8s %12s %9s %9s" % ('in', 'out', 'continuous', 'defuzzify', 'upsample',
+                                                  'samples/s', 'max dev', 'mean dev'))
+    for r in results:
+        print("%6g %6g %10s %16s %8d %12.0f %9.4f %9.4f" % (
+            r['input_step'], r['output_step'], r['continuous'], r['defuzzify_method'], r['upsample'],
+            r['samples_per_second'], r['max_deviation'], r['mean_deviation']))
+    if args.max_deviation is not None:
+        if choice is None:
+            print("No setting is within a max deviation of %g" % args.max_deviation)
+        else:
+            print("Cheapest within %g: input_step=%g output_step=%g continuous=%s defuzzify_method=%s upsample=%d" % (
+                args.max_deviation, choice['input_step'], choice['output_step'], choice['continuous'],
+                choice['defuzzify_method'], choice['upsample']))
+
+
+if __name__ == '__main__':
+    main()
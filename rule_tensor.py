@@ -0,0 +1,186 @@
+"""
+Compiled, array form of a fuzzy rule base.
+
+A rule base of AND-ed antecedents with one consequent term each is stored
+as integer term indices instead of linked skfuzzy objects, so inference
+can gather memberships directly without walking ``ctrl.Rule`` graphs.
+"""
+import csv
+
+import numpy as np
+
+WILDCARD = -1
+WILDCARD_LABEL = '*'
+
+
+def _conjunction_terms(antecedent):
+    """
+    Returns the list of Terms AND-ed together in a rule antecedent.
+    """
+    # Imported here so loading a compiled model does not need skfuzzy
+    from skfuzzy.control.term import Term, TermAggregate
+
+    if isinstance(antecedent, Term):
+        return [antecedent]
+    if isinstance(antecedent, TermAggregate) and antecedent.kind == 'and':
+        return (_conjunction_terms(antecedent.term1)
+                + _conjunction_terms(antecedent.term2))
+    raise ValueError("Only AND-ed antecedents are supported, got %r" % (antecedent,))
+
+
+def _rule_weight(rule):
+    """
+    Returns the effective weight of a rule.
+
+    ``rule.weight`` is what the GA in main.py tunes; skfuzzy itself only
+    knows about consequent weights, so both are applied.
+    """
+    if len(rule.consequent) != 1:
+        raise ValueError("Only single-consequent rules are supported")
+    return float(getattr(rule, 'weight', 1.0)) * float(rule.consequent[0].weight)
+
+
+def rule_variables(rules):
+    """
+    Returns (antecedents, consequent) fuzzy variables used by the rules,
+    antecedents in order of first appearance.
+    """
+    antecedents = []
+    consequent = None
+    for rule in rules:
+        for term in _conjunction_terms(rule.antecedent):
+            if term.parent not in antecedents:
+                antecedents.append(term.parent)
+        if len(rule.consequent) != 1:
+            raise ValueError("Only single-consequent rules are supported")
+        out_var = rule.consequent[0].term.parent
+        if consequent is None:
+            consequent = out_var
+        elif out_var is not consequent:
+            raise ValueError("All rules must share a single consequent")
+    return antecedents, consequent
+
+
+class RuleTensor:
+    """
+    Rule base as index arrays.
+
+    ``index[r, v]`` is the term of antecedent variable ``v`` used by rule
+    ``r`` (``WILDCARD`` if the rule leaves that variable out),
+    ``consequent[r]`` is its output term and ``weights[r]`` its weight.
+    """
+
+    def __init__(self, variables, term_labels, output_label, output_labels,
+                 index, consequent, weights=None):
+        self.variables = list(variables)
+        self.term_labels = [list(labels) for labels in term_labels]
+        self.output_label = output_label
+        self.output_labels = list(output_labels)
+        self.index = np.asarray(index, dtype=np.intp)
+        self.consequent = np.asarray(consequent, dtype=np.intp)
+        if weights is None:
+            weights = np.ones(len(self.consequent))
+        self.weights = np.asarray(weights, dtype=np.float64)
+
+    def __len__(self):
+        return len(self.consequent)
+
+    @property
+    def wildcard(self):
+        """
+        Boolean (rules, variables) mask of left-out antecedent variables.
+        """
+        return self.index == WILDCARD
+
+    @classmethod
+    def from_rules(cls, rules):
+        """
+        Compiles a list of ``ctrl.Rule`` objects.
+        """
+        antecedents, consequent_var = rule_variables(rules)
+        parsed = [(_conjunction_terms(rule.antecedent), rule.consequent[0].term, _rule_weight(rule))
+                  for rule in rules]
+
+        term_labels = [list(var.terms) for var in antecedents]
+        output_labels = list(consequent_var.terms)
+        index = np.full((len(parsed), len(antecedents)), WILDCARD, dtype=np.intp)
+        consequent = np.empty(len(parsed), dtype=np.intp)
+        weights = np.empty(len(parsed))
+        for r, (terms, out_term, weight) in enumerate(parsed):
+            for term in terms:
+                v = antecedents.index(term.parent)
+                if index[r, v] != WILDCARD:
+                    raise ValueError("Rule %d uses %r twice" % (r, term.parent.label))
+                index[r, v] = term_labels[v].index(term.label)
+            consequent[r] = output_labels.index(out_term.label)
+            weights[r] = weight
+        return cls([var.label for var in antecedents], term_labels,
+                   consequent_var.label, output_labels, index, consequent, weights)
+
+    def dense(self):
+        """
+        Returns (consequent, weight) tensors indexed by layer, then by term
+        per variable.
+
+        Each term axis has one extra trailing slot that stands for "any
+        term", holding the wildcard rules. Rules sharing an antecedent are
+        merged per consequent, keeping the largest weight as max
+        aggregation would, and each further consequent of the same
+        antecedent goes into another layer; a rule base without such rules
+        has a single layer. Empty cells have consequent ``WILDCARD``.
+        """
+        shape = tuple(len(labels) + 1 for labels in self.term_labels)
+        cells = {}
+        for r in range(len(self)):
+            cell = tuple(np.where(self.index[r] == WILDCARD, np.array(shape) - 1, self.index[r]))
+            merged = cells.setdefault(cell, {})
+            out_term = int(self.consequent[r])
+            weight = float(self.weights[r])
+            merged[out_term] = max(merged[out_term], weight) if out_term in merged else weight
+        layers = max([len(merged) for merged in cells.values()] or [1])
+        consequent = np.full((layers,) + shape, WILDCARD, dtype=np.intp)
+        weights = np.zeros((layers,) + shape)
+        for cell, merged in cells.items():
+            for layer, (out_term, weight) in enumerate(sorted(merged.items())):
+                consequent[(layer,) + cell] = out_term
+                weights[(layer,) + cell] = weight
+        return consequent, weights
+
+    def to_table(self, path):
+        """
+        Writes the rule base as CSV: one column per variable holding term
+        labels (``*`` for wildcards), then the output term and the weight.
+        """
+        with open(path, 'w', newline='') as f:
+            writer = csv.writer(f)
+            writer.writerow(self.variables + [self.output_label, 'weight'])
+            for r in range(len(self)):
+                row = [WILDCARD_LABEL if t == WILDCARD else labels[t]
+                       for t, labels in zip(self.index[r], self.term_labels)]
+                writer.writerow(row + [self.output_labels[self.consequent[r]], repr(float(self.weights[r]))])
+
+    @classmethod
+    def from_table(cls, path, term_labels, output_labels):
+        """
+        Reads a table written by ``to_table``.
+
+        Term labels are not stored in the table, so their order has to be
+        given, e.g. ``[diastolic_labels, systolic_labels, temperature_labels]``
+        and ``health_care_labels`` from health_care.py.
+        """
+        with open(path, newline='') as f:
+            reader = csv.reader(f)
+            header = next(reader)
+            rows = [row for row in reader if row]
+        variables, output_label = header[:-2], header[-2]
+        if len(variables) != len(term_labels):
+            raise ValueError("Table has %d variables, got labels for %d" % (len(variables), len(term_labels)))
+        index = np.empty((len(rows), len(variables)), dtype=np.intp)
+        consequent = np.empty(len(rows), dtype=np.intp)
+        weights = np.empty(len(rows))
+        for r, row in enumerate(rows):
+            for v, label in enumerate(row[:-2]):
+                index[r, v] = WILDCARD if label == WILDCARD_LABEL else list(term_labels[v]).index(label)
+            consequent[r] = list(output_labels).index(row[-2])
+            weights[r] = float(row[-1])
+        return cls(variables, term_labels, output_label, output_labels, index, consequent, weights)
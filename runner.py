@@ -1,6 +1,8 @@
 import pygame
 import sys
+import threading
 import time
+from concurrent.futures import ThreadPoolExecutor
 
 import tictactoe as ttt
 
@@ -17,14 +19,59 @@ mediumFont = pygame.font.Font("OpenSans-Regular.ttf", 28)
 largeFont = pygame.font.Font("OpenSans-Regular.ttf", 40)
 moveFont = pygame.font.Font("OpenSans-Regular.ttf", 60)
 
+fps = 30  # frame rate cap, keeps the loop from spinning a core
+ai_min_think = 0.5  # seconds "Computer thinking..." stays up, even if the move is found sooner
+click_pause = 0.2  # seconds clicks are ignored after a button press, so one press acts once
+clock = pygame.time.Clock()
+
+
+
+class SearchCancelled(Exception):
+    pass
+
+
+class CancellableStats(ttt.SearchStats):
+    """
+    SearchStats that stops the search counting with it, at the next
+    position visited, once ``cancel`` is called from another thread.
+    """
+
+    def __init__(self):
+        self.cancelled = threading.Event()
+        super().__init__()
+
+    @property
+    def nodes(self):
+        return self._nodes
+
+    @nodes.setter
+    def nodes(self, value):
+        if self.cancelled.is_set():
+            raise SearchCancelled()
+        self._nodes = value
+
+    def cancel(self):
+        self.cancelled.set()
+
+
+# The AI searches on a worker thread so the window keeps drawing and
+# handling events. ai_search holds (future, board searched, start time,
+# stats) while the computer thinks; a result is only played if the board
+# is still the one it was searched for.
+ai_executor = ThreadPoolExecutor(max_workers=1)
+ai_search = None
+ignore_clicks_until = 0.0
+
 user = None
 board = ttt.initial_state()
-ai_turn = False
 
 while True:
 
     for event in pygame.event.get():
         if event.type == pygame.QUIT:
+            if ai_search is not None:
+                ai_search[3].cancel()
+            ai_executor.shutdown(wait=False, cancel_futures=True)
             sys.exit()
 
     screen.fill(black)
@@ -55,13 +102,13 @@ while True:
 
         # Check if button is clicked
         click, _, _ = pygame.mouse.get_pressed()
-        if click == 1:
+        if click == 1 and time.monotonic() >= ignore_clicks_until:
             mouse = pygame.mouse.get_pos()
             if playXButton.collidepoint(mouse):
-                time.sleep(0.2)
+                ignore_clicks_until = time.monotonic() + click_pause
                 user = ttt.X
             elif playOButton.collidepoint(mouse):
-                time.sleep(0.2)
+                ignore_clicks_until = time.monotonic() + click_pause
                 user = ttt.O
 
     else:
@@ -110,24 +157,27 @@ while True:
 
         # Check for AI move
         if user != player and not game_over:
-            if ai_turn:
-                time.sleep(0.5)
-                move = ttt.minimax(board)
-                board = ttt.result(board, move)
-                ai_turn = False
+            if ai_search is None:
+                stats = CancellableStats()
+                ai_search = (ai_executor.submit(ttt.minimax, board, stats=stats), board, time.monotonic(), stats)
             else:
-                ai_turn = True
+                future, searched_board, started, _ = ai_search
+                if future.done() and time.monotonic() - started >= ai_min_think:
+                    ai_search = None
+                    if searched_board is board:
+                        board = ttt.result(board, future.result())
 
         # Check for a user move
         click, _, _ = pygame.mouse.get_pressed()
-        if click == 1 and user == player and not game_over:
+        if click == 1 and user == player and not game_over and time.monotonic() >= ignore_clicks_until:
             mouse = pygame.mouse.get_pos()
             for i in range(3):
                 for j in range(3):
                     if (board[i][j] == ttt.EMPTY and tiles[i][j].collidepoint(mouse)):
                         board = ttt.result(board, (i, j))
 
-        if game_over:
+        # Play Again also cancels a search in progress
+        if game_over or ai_search is not None:
             againButton = pygame.Rect(width / 3, height - 65, width / 3, 50)
             again = mediumFont.render("Play Again", True, black)
             againRect = again.get_rect()
@@ -135,12 +185,17 @@ while True:
             pygame.draw.rect(screen, white, againButton)
             screen.blit(again, againRect)
             click, _, _ = pygame.mouse.get_pressed()
-            if click == 1:
+            if click == 1 and time.monotonic() >= ignore_clicks_until:
                 mouse = pygame.mouse.get_pos()
                 if againButton.collidepoint(mouse):
-                    time.sleep(0.2)
+                    ignore_clicks_until = time.monotonic() + click_pause
                     user = None
                     board = ttt.initial_state()
-                    ai_turn = False
+                    if ai_search is not None:
+                        # Stop the search so the worker is free for the next game
+                        ai_search[0].cancel()
+                        ai_search[3].cancel()
+                        ai_search = None
 
     pygame.display.flip()
+    clock.tick(fps)
@@ -0,0 +1,186 @@
+"""
+Streaming Health Care scoring for vitals files of any size.
+
+Reads CSV or JSONL records in fixed-size chunks, scores each chunk with one
+batched engine call and appends the results to the output file before
+reading on, so memory use depends on the chunk size, not the input size.
+
+    python score_stream.py vitals.csv scored.csv --chunk-size 20000 --workers 4
+"""
+import argparse
+import csv
+import json
+import math
+import multiprocessing
+import sys
+import time
+from collections import deque
+
+import numpy as np
+
+from dataset import INPUT_COLUMNS, TARGET_COLUMN
+
+
+def default_engine(model_path=None):
+    """
+    Returns the engine saved in ``model_path``, or the one for the rules
+    defined in health_care.py if no path is given.
+    """
+    if model_path is not None:
+        from model_file import load_model
+        return load_model(model_path)
+    import health_care
+    return health_care.health_care_engine
+
+
+def _is_jsonl(path):
+    return str(path).endswith(('.jsonl', '.ndjson'))
+
+
+def read_chunks(path, chunk_size):
+    """
+    Yields lists of up to ``chunk_size`` records (dicts) from a CSV file with
+    a header row or from a JSONL file.
+    """
+    with open(path, newline='') as f:
+        if _is_jsonl(path):
+            records = (json.loads(line) for line in f if line.strip())
+        else:
+            records = csv.DictReader(f)
+        chunk = []
+        for record in records:
+            chunk.append(record)
+            if len(chunk) == chunk_size:
+                yield chunk
+                chunk = []
+        if chunk:
+            yield chunk
+
+
+def _to_float(value):
+    try:
+        return float(value)
+    except (TypeError, ValueError):
+        return math.nan
+
+
+def chunk_inputs(chunk):
+    """
+    Returns one float array per INPUT_COLUMNS entry for a chunk of records.
+
+    Column names are matched case-insensitively; missing or non-numeric
+    values become NaN and score as NaN.
+    """
+    keys = {key.strip().lower(): key for key in chunk[0]}
+    missing = [name for name in INPUT_COLUMNS if name not in keys]
+    if missing:
+        raise ValueError("Records are missing columns: %s" % ', '.join(missing))
+    return tuple(np.array([_to_float(record.get(keys[name])) for record in chunk])
+                 for name in INPUT_COLUMNS)
+
+
+class _Writer:
+    """
+    Appends scored records to a CSV or JSONL file.
+    """
+
+    def __init__(self, f, path):
+        self.f = f
+        self.jsonl = _is_jsonl(path)
+        self.csv = None
+
+    def write(self, chunk, scores):
+        for record, score in zip(chunk, scores):
+            score = None if np.isnan(score) else float(score)
+            record[TARGET_COLUMN] = score
+            if self.jsonl:
+                self.f.write(json.dumps(record) + '\n')
+            else:
+                if self.csv is None:
+                    self.csv = csv.DictWriter(self.f, fieldnames=list(record))
+                    self.csv.writeheader()
+                record[TARGET_COLUMN] = '' if score is None else repr(score)
+                self.csv.writerow(record)
+
+
+_worker_engine = None
+
+
+def _init_worker(engine):
+    global _worker_engine
+    _worker_engine = engine
+
+
+def _score(inputs):
+    return _worker_engine.compute(*inputs)
+
+
+def score_file(input_path, output_path, engine=None, chunk_size=10000, workers=1, progress=None):
+    """
+    Scores every record of ``input_path`` into ``output_path``.
+
+    With ``workers`` > 1 chunks are scored in a process pool that holds at
+    most two chunks per worker in flight, so memory stays bounded however
+    fast the file can be read. Output order always matches input order.
+    ``progress``, if given, is called with (rows, seconds) after each
+    chunk. Returns the same pair for the whole run.
+    """
+    if engine is None:
+        engine = default_engine()
+    start = time.perf_counter()
+    rows = 0
+    pool = None
+    if workers > 1:
+        pool = multiprocessing.Pool(workers, initializer=_init_worker, initargs=(engine,))
+    try:
+        with open(output_path, 'w', newline='') as f:
+            writer = _Writer(f, output_path)
+            pending = deque()
+
+            def flush_oldest():
+                nonlocal rows
+                chunk, result = pending.popleft()
+                writer.write(chunk, result.get() if pool is not None else result)
+                f.flush()
+                rows += len(chunk)
+                if progress is not None:
+                    progress(rows, time.perf_counter() - start)
+
+            for chunk in read_chunks(input_path, chunk_size):
+                inputs = chunk_inputs(chunk)
+                if pool is not None:
+                    pending.append((chunk, pool.apply_async(_score, (inputs,))))
+                    if len(pending) >= 2 * workers:
+                        flush_oldest()
+                else:
+                    pending.append((chunk, engine.compute(*inputs)))
+                    flush_oldest()
+            while pending:
+                flush_oldest()
+    finally:
+        if pool is not None:
+            pool.close()
+            pool.join()
+    return rows, time.perf_counter() - start
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Score a CSV or JSONL file of vitals with the Health Care fuzzy system.")
+    parser.add_argument('input', help="CSV (with header) or .jsonl file with %s columns" % ', '.join(INPUT_COLUMNS))
+    parser.add_argument('output', help="file to write, .jsonl for JSONL and CSV otherwise")
+    parser.add_argument('--model', help="compiled model (.npz) to score with instead of health_care.py")
+    parser.add_argument('--chunk-size', type=int, default=10000, help="records scored per batch (default 10000)")
+    parser.add_argument('--workers', type=int, default=1, help="scoring processes (default 1)")
+    parser.add_argument('--quiet', action='store_true', help="do not report progress")
+    args = parser.parse_args(argv)
+
+    def report(rows, seconds):
+        print("%d rows, %.0f rows/s" % (rows, rows / max(seconds, 1e-9)), file=sys.stderr)
+
+    rows, seconds = score_file(args.input, args.output, engine=default_engine(args.model), chunk_size=args.chunk_size, workers=args.workers,
+                               progress=None if args.quiet else report)
+    print("Scored %d rows in %.2fs (%.0f rows/s)" % (rows, seconds, rows / max(seconds, 1e-9)), file=sys.stderr)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,193 @@
+"""
+Batched output-surface sweeps over the Health Care inputs.
+
+``sweep`` evaluates the model on any grid over diastolic, systolic and
+temperature in one engine call. Each input is either swept over an array
+of values (by default its whole universe) or held at a single value, so
+the result is a 1D curve, a 2D surface or a 3D volume, returned as a
+``Surface`` that keeps the name and coordinates of every axis.
+
+    python surface_sweep.py --temperature 98 100 102 104 --plot surface.png
+    python surface_sweep.py --diastolic 80 --systolic 90:200:0.5 --output curve.npz
+"""
+import argparse
+
+import numpy as np
+
+from dataset import INPUT_COLUMNS, TARGET_COLUMN
+
+
+class Surface:
+    """
+    Model output on a grid: ``values`` has one axis per entry of ``dims``,
+    with coordinates ``coords[dim]``. Inputs held at a single value are in
+    ``fixed`` instead.
+    """
+
+    def __init__(self, values, dims, coords, fixed=None):
+        self.values = np.asarray(values)
+        self.dims = tuple(dims)
+        self.coords = {dim: np.asarray(coords[dim]) for dim in self.dims}
+        self.fixed = dict(fixed or {})
+        if self.values.shape != tuple(len(self.coords[dim]) for dim in self.dims):
+            raise ValueError("values shape %s does not match the coordinates" % (self.values.shape,))
+
+    @property
+    def shape(self):
+        return self.values.shape
+
+    def sel(self, **points):
+        """
+        Returns the surface with the given dims held at the grid value
+        nearest to each requested value, e.g. ``surface.sel(temperature=100)``.
+        """
+        index = []
+        fixed = dict(self.fixed)
+        dims = []
+        for dim in self.dims:
+            if dim in points:
+                i = int(np.abs(self.coords[dim] - points[dim]).argmin())
+                index.append(i)
+                fixed[dim] = float(self.coords[dim][i])
+            else:
+                index.append(slice(None))
+                dims.append(dim)
+        return Surface(self.values[tuple(index)], dims, self.coords, fixed)
+
+    def save(self, path):
+        """
+        Writes the surface to an ``.npz`` file readable by ``Surface.load``.
+        """
+        arrays = {'values': self.values, 'dims': np.array(self.dims, dtype=str),
+                  'fixed_names': np.array(list(self.fixed), dtype=str),
+                  'fixed_values': np.array(list(self.fixed.values()), dtype=np.float64)}
+        for dim in self.dims:
+            arrays['coord_' + dim] = self.coords[dim]
+        np.savez(path, **arrays)
+
+    @classmethod
+    def load(cls, path):
+        with np.load(path) as data:
+            dims = [str(dim) for dim in data['dims']]
+            fixed = dict(zip((str(name) for name in data['fixed_names']), data['fixed_values'].tolist()))
+            return cls(data['values'], dims, {dim: data['coord_' + dim] for dim in dims}, fixed)
+
+    def _title(self):
+        return ', '.join('%s=%g' % item for item in self.fixed.items())
+
+    def plot(self, path=None):
+        """
+        Renders the surface with matplotlib: a line for 1D, a heat map for
+        2D and one heat map per value of the last dim for 3D. Saves to
+        ``path`` if given, otherwise returns the figure.
+        """
+        import matplotlib.pyplot as plt
+
+        if len(self.dims) == 1:
+            fig, ax = plt.subplots()
+            ax.plot(self.coords[self.dims[0]], self.values)
+            ax.set_xlabel(self.dims[0])
+            ax.set_ylabel(TARGET_COLUMN)
+            ax.set_title(self._title())
+        elif len(self.dims) in (2, 3):
+            panels = [self] if len(self.dims) == 2 else [
+                self.sel(**{self.dims[2]: value}) for value in self.coords[self.dims[2]]]
+            columns = min(len(panels), 4)
+            rows = -(-len(panels) // columns)
+            fig, axes = plt.subplots(rows, columns, squeeze=False, figsize=(4 * columns, 3.5 * rows),
+                                     sharex=True, sharey=True)
+            vmin, vmax = np.nanmin(self.values), np.nanmax(self.values)
+            for ax, panel in zip(axes.flat, panels):
+                x, y = panel.dims
+                mesh = ax.pcolormesh(panel.coords[y], panel.coords[x], panel.values,
+                                     shading='auto', vmin=vmin, vmax=vmax)
+                ax.set_xlabel(y)
+                ax.set_ylabel(x)
+                ax.set_title(panel._title())
+            for ax in axes.flat[len(panels):]:
+                ax.set_visible(False)
+            fig.colorbar(mesh, ax=axes, label=TARGET_COLUMN)
+        else:
+            raise ValueError("Can only plot 1D, 2D or 3D surfaces")
+        if path is None:
+            return fig
+        fig.savefig(path)
+        plt.close(fig)
+
+
+def sweep(engine=None, **grid):
+    """
+    Returns the ``Surface`` of ``engine`` (health_care.py's rules by
+    default, with their current weights) over a grid.
+
+    Keywords are INPUT_COLUMNS names. An array sweeps that input, a scalar
+    holds it fixed and an omitted input sweeps its whole universe.
+    """
+    if engine is None:
+        import health_care
+        engine = health_care.health_care_engine
+    if getattr(engine, 'rules', None) is not None:
+        engine.refresh_weights()
+    unknown = set(grid) - set(INPUT_COLUMNS)
+    if unknown:
+        raise ValueError("Unknown inputs: %s" % ', '.join(sorted(unknown)))
+
+    dims = []
+    coords = {}
+    fixed = {}
+    for name, universe in zip(INPUT_COLUMNS, engine.universes):
+        values = np.asarray(grid.get(name, universe), dtype=np.float64)
+        if values.ndim == 0:
+            fixed[name] = float(values)
+        else:
+            dims.append(name)
+            coords[name] = values
+
+    # Open grids broadcast to the full one inside compute
+    axes = iter(np.ix_(*[coords[dim] for dim in dims]))
+    inputs = [fixed[name] if name in fixed else next(axes) for name in INPUT_COLUMNS]
+    values = engine.compute(*inputs)
+    return Surface(values.reshape([len(coords[dim]) for dim in dims]), dims, coords, fixed)
+
+
+def _grid_values(text):
+    """
+    Parses "start:stop:step" (stop included) or a single number.
+    """
+    if ':' in text:
+        start, stop, step = (float(part) for part in text.split(':'))
+        return np.arange(start, stop + step / 2, step)
+    return np.array([float(text)])
+
+
+def _grid_arg(values):
+    if values is None:
+        return None
+    values = np.concatenate([_grid_values(text) for text in values])
+    return values[0] if len(values) == 1 else values
+
+
+def main(argv=None):
+    from score_stream import default_engine
+
+    parser = argparse.ArgumentParser(description="Sweep the Health Care output over a grid of inputs.")
+    for name in INPUT_COLUMNS:
+        parser.add_argument('--' + name, nargs='+', metavar='VALUE',
+                            help="values or start:stop:step ranges (one value holds it fixed, default: whole universe)")
+    parser.add_argument('--model', help="compiled model (.npz) to sweep instead of health_care.py")
+    parser.add_argument('--output', help="write the surface to this .npz file")
+    parser.add_argument('--plot', help="render the surface to this image file")
+    args = parser.parse_args(argv)
+
+    grid = {name: _grid_arg(getattr(args, name)) for name in INPUT_COLUMNS}
+    surface = sweep(default_engine(args.model), **{name: values for name, values in grid.items() if values is not None})
+    print("%s surface over %s" % ('x'.join(str(n) for n in surface.shape) or 'scalar',
+                                  ', '.join(surface.dims) or surface._title()))
+    if args.output:
+        surface.save(args.output)
+    if args.plot:
+        surface.plot(args.plot)
+
+
+if __name__ == '__main__':
+    main()
@@ -3,6 +3,7 @@ Tic Tac Toe Player
 """
 import copy
 import math
+from collections import OrderedDict
 
 X = "X"
 O = "O"
@@ -108,46 +109,276 @@ def utility(board):
         else:
             return 0
 
-def minimax_value(board):
+def _symmetries():
+    """
+    Returns the 8 rotations and reflections of the board as cell orders:
+    cell k of the transformed board (k = 3 * i + j) is cell order[k] of
+    the original.
+    """
+    orders = []
+    for transpose in (False, True):
+        for turns in range(4):
+            order = []
+            for row in range(3):
+                for col in range(3):
+                    i, j = (col, row) if transpose else (row, col)
+                    for _ in range(turns):
+                        i, j = j, 2 - i
+                    order.append(3 * i + j)
+            orders.append(tuple(order))
+    return orders
+
+
+SYMMETRIES = _symmetries()
+_CELL_CODES = {EMPTY: 0, X: 1, O: 2}
+
+
+def canonical(board):
+    """
+    Returns (key, symmetry) for a board, where key is the same for all 8
+    rotations and reflections of it and SYMMETRIES[symmetry] is the cell
+    order that turns the board into its canonical orientation.
+    """
+    cells = [_CELL_CODES[cell] for row in board for cell in row]
+    return min((tuple(cells[k] for k in order), t) for t, order in enumerate(SYMMETRIES))
+
+
+def _to_canonical(action, symmetry):
+    if action is None:
+        return None
+    return divmod(SYMMETRIES[symmetry].index(3 * action[0] + action[1]), 3)
+
+
+def _from_canonical(action, symmetry):
+    if action is None:
+        return None
+    return divmod(SYMMETRIES[symmetry][3 * action[0] + action[1]], 3)
+
+
+class TranspositionTable:
+    """
+    Bounded cache of minimax results keyed by canonical board, dropping the
+    least recently used entry once maxsize entries are stored.
+    """
+
+    def __init__(self, maxsize=10000):
+        self.maxsize = maxsize
+        self.entries = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, key):
+        entry = self.entries.get(key)
+        if entry is None:
+            self.misses += 1
+        else:
+            self.hits += 1
+            self.entries.move_to_end(key)
+        return entry
+
+    def put(self, key, entry):
+        self.entries[key] = entry
+        self.entries.move_to_end(key)
+        if len(self.entries) > self.maxsize:
+            self.entries.popitem(last=False)
+
+    def clear(self):
+        self.entries.clear()
+        self.hits = 0
+        self.misses = 0
+
+    def stats(self):
+        """
+        Returns hit/miss counts and the number of stored positions.
+        """
+        return {'hits': self.hits, 'misses': self.misses, 'size': len(self.entries), 'maxsize': self.maxsize}
+
+
+transposition_table = TranspositionTable()
+
+
+class SearchStats:
+    """
+    Counts the positions a search visits.
+    """
+
+    def __init__(self):
+        self.nodes = 0
+
+
+def minimax_value(board, table=transposition_table, stats=None):
+    """
+    Returns (value, best move) of a board. Results are stored in ``table``
+    under the board's canonical key, so symmetric positions are searched
+    once; pass table=None to search without it.
+    """
+    if stats is not None:
+        stats.nodes += 1
     if terminal(board):
         return utility(board), None
 
+    if table is not None:
+        key, symmetry = canonical(board)
+        entry = table.get(key)
+        if entry is not None:
+            value, move = entry
+            return value, _from_canonical(move, symmetry)
+
     if player(board)==X:
         value = float('-inf')
         best_move = None
         for action in actions(board):
-            score, _ = minimax_value(result(board, action))
+            score, _ = minimax_value(result(board, action), table, stats)
             if score is not None and score > value:
                 value = score
                 best_move = action
-        return value, best_move
     else:
         value = float('inf')
         best_move = None
         for action in actions(board):
-            score, _ = minimax_value(result(board, action))
+            score, _ = minimax_value(result(board, action), table, stats)
             if score is not None and score < value:
                 value = score
                 best_move = action
-        return value, best_move
 
+    if table is not None:
+        table.put(key, (value, _to_canonical(best_move, symmetry)))
+    return value, best_move
+
+
+# Rows, columns and diagonals as (i, j) cells
+LINES = [[(i, 0), (i, 1), (i, 2)] for i in range(3)] + \
+        [[(0, j), (1, j), (2, j)] for j in range(3)] + \
+        [[(0, 0), (1, 1), (2, 2)], [(0, 2), (1, 1), (2, 0)]]
+
+CENTER = (1, 1)
+CORNERS = [(0, 0), (0, 2), (2, 0), (2, 2)]
+
+
+def _completing_moves(board, mark):
+    """
+    Returns the empty cells that would complete a line of ``mark``.
+    """
+    moves = []
+    for line in LINES:
+        marks = [board[i][j] for i, j in line]
+        if marks.count(mark) == 2 and marks.count(EMPTY) == 1:
+            moves.append(line[marks.index(EMPTY)])
+    return moves
+
+
+def ordered_actions(board):
+    """
+    Returns the actions of a board, most promising first: immediate wins,
+    then blocks of the opponent's wins, then the center, corners and edges.
+    """
+    mark = player(board)
+    first = _completing_moves(board, mark) + _completing_moves(board, O if mark == X else X)
+    rank = {CENTER: 0}
+    rank.update((corner, 1) for corner in CORNERS)
+    ordered = []
+    for action in first + sorted(actions(board), key=lambda action: rank.get(action, 2)):
+        if action not in ordered:
+            ordered.append(action)
+    return ordered
+
+
+def alphabeta_value(board, alpha=float('-inf'), beta=float('inf'), stats=None):
+    """
+    Returns the value minimax_value gives a board, searched with
+    alpha-beta pruning over ordered_actions.
+
+    Exact when the true value lies inside (alpha, beta); otherwise only a
+    bound on the side of the window it falls. A proven win (the best
+    value the player to move can get) ends the search of a node at once.
+    """
+    if stats is not None:
+        stats.nodes += 1
+    if terminal(board):
+        return utility(board)
+
+    if player(board) == X:
+        value = float('-inf')
+        for action in ordered_actions(board):
+            score = alphabeta_value(result(board, action), alpha, beta, stats)
+            if score is not None and score > value:
+                value = score
+                alpha = max(alpha, value)
+                if alpha >= beta:
+                    break
+    else:
+        value = float('inf')
+        for action in ordered_actions(board):
+            score = alphabeta_value(result(board, action), alpha, beta, stats)
+            if score is not None and score < value:
+                value = score
+                beta = min(beta, value)
+                if alpha >= beta:
+                    break
+    return value
 
-def minimax(board):
+
+def minimax(board, search='lookup', stats=None):
     """
     Returns the optimal move for the player to move on the board.
+
+    ``search`` picks how the moves are found: 'lookup' (read from the
+    precomputed table of perfect_play.py, falling back to 'table' when it
+    is missing, stale or lacks the board), 'table' (minimax with the
+    transposition table), 'alphabeta', 'bitboard' (alpha-beta on the
+    bitboard engine, see bitboard.py) or 'minimax' (plain exhaustive
+    search). All of them return the same move. ``stats``, a SearchStats,
+    counts the positions visited.
     """
+    if search == 'lookup':
+        import perfect_play
+        table = perfect_play.default_table()
+        if table is not None:
+            try:
+                return table.lookup(board)[1]
+            except KeyError:
+                pass
+        search = 'table'
+    if search == 'bitboard':
+        import bitboard
+        return bitboard.minimax(board, stats)
     if terminal(board):
         return None
 
+    if search == 'table':
+        value = lambda child: minimax_value(child, transposition_table, stats)[0]
+    elif search == 'alphabeta':
+        value = lambda child: alphabeta_value(child, stats=stats)
+    elif search == 'minimax':
+        value = lambda child: minimax_value(child, None, stats)[0]
+    else:
+        raise ValueError("Unknown search %r" % (search,))
+
+    maximizing = player(board) == X
     best_move = None
-    best_score = float('-inf') if player(board)==X else float('inf')
+    best_score = float('-inf') if maximizing else float('inf')
 
     for action in actions(board):
-        score ,_= minimax_value(result(board, action))
+        score = value(result(board, action))
         if score is not None:
 
-            if (player(board)==X and score > best_score) or (not player(board)==X and score < best_score):
+            if (maximizing and score > best_score) or (not maximizing and score < best_score):
                 best_score = score
                 best_move = action
 
-    return best_move
\ No newline at end of file
+    return best_move
+
+
+def node_counts(board):
+    """
+    Returns the number of positions minimax visits to choose a move on a
+    board with each search mode (the table starting empty).
+    """
+    counts = {}
+    for search in ('minimax', 'alphabeta', 'table'):
+        if search == 'table':
+            transposition_table.clear()
+        stats = SearchStats()
+        minimax(board, search, stats)
+        counts[search] = stats.nodes
+    return counts